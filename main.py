@@ -1,5 +1,7 @@
 import sys
+import sqlite3
 from PySide2.QtWidgets import QApplication
+from src.cache import SolutionCache, default_cache_path
 from src.model import FunctionModel
 from src.view import MainWindow
 from src.controller import MainController
@@ -7,7 +9,12 @@ from src.controller import MainController
 if __name__ == "__main__":
     app = QApplication(sys.argv)
 
-    model = FunctionModel()
+    try:
+        solution_cache = SolutionCache(default_cache_path())
+    except (OSError, sqlite3.Error):
+        solution_cache = None
+
+    model = FunctionModel(solution_cache=solution_cache)
     view = MainWindow()
     controller = MainController(model, view)
 
@@ -0,0 +1,136 @@
+"""Persistent SQLite cache of symbolic solutions.
+
+Root sets are stored per equation, keyed by the ``srepr`` of ``fx - gx``,
+independently of the plot range, so a solve done in one session can be
+reused by the next one for any range.
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+
+import sympy
+from sympy import srepr, sympify
+
+# Bump when the stored format changes; entries from other versions are dropped
+CACHE_VERSION = 1
+
+
+def default_cache_path():
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "pymathplot", "solutions.sqlite")
+
+
+class SolutionCache:
+    def __init__(self, path, max_bytes=16 * 1024 * 1024):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._version = f"{CACHE_VERSION}:{sympy.__version__}"
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._setup()
+
+    def _setup(self):
+        with self._lock, self._conn:
+            self._conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+            row = self._conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+            if row is None or row[0] != self._version:
+                self._conn.execute("DROP TABLE IF EXISTS solutions")
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('version', ?)", (self._version,)
+                )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS solutions ("
+                "key TEXT PRIMARY KEY, roots TEXT NOT NULL, "
+                "size INTEGER NOT NULL, last_used REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS timings ("
+                "id INTEGER PRIMARY KEY AUTOINCREMENT, method TEXT NOT NULL, ratio REAL NOT NULL)"
+            )
+
+    @staticmethod
+    def key(expr):
+        return srepr(expr)
+
+    def get(self, key):
+        """Cached roots for ``key``, or None on a miss"""
+        try:
+            with self._lock, self._conn:
+                row = self._conn.execute("SELECT roots FROM solutions WHERE key = ?", (key,)).fetchone()
+                if row is None:
+                    return None
+                self._conn.execute("UPDATE solutions SET last_used = ? WHERE key = ?", (time.time(), key))
+            return [sympify(root) for root in json.loads(row[0])]
+        except (sqlite3.Error, ValueError, sympy.SympifyError):
+            return None
+
+    def put(self, key, roots):
+        payload = json.dumps([srepr(root) for root in roots])
+        size = len(key) + len(payload)
+        if size > self.max_bytes:
+            return
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO solutions (key, roots, size, last_used) VALUES (?, ?, ?, ?)",
+                    (key, payload, size, time.time()),
+                )
+                self._evict()
+        except sqlite3.Error:
+            pass
+
+    def _evict(self):
+        # Least recently used entries go first until the total fits again
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM solutions").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        stale = []
+        for key, size in self._conn.execute("SELECT key, size FROM solutions ORDER BY last_used"):
+            if total <= self.max_bytes:
+                break
+            stale.append((key,))
+            total -= size
+        self._conn.executemany("DELETE FROM solutions WHERE key = ?", stale)
+
+    def record_timing(self, method, ratio, keep=200):
+        """Store a measured/predicted solve time ratio, keeping the latest ``keep``"""
+        try:
+            with self._lock, self._conn:
+                self._conn.execute("INSERT INTO timings (method, ratio) VALUES (?, ?)", (method, ratio))
+                self._conn.execute(
+                    "DELETE FROM timings WHERE method = ? AND id NOT IN "
+                    "(SELECT id FROM timings WHERE method = ? ORDER BY id DESC LIMIT ?)",
+                    (method, method, keep),
+                )
+        except sqlite3.Error:
+            pass
+
+    def timing_ratios(self, method, limit):
+        """The latest ``limit`` timing ratios for ``method``, oldest first"""
+        try:
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT ratio FROM timings WHERE method = ? ORDER BY id DESC LIMIT ?", (method, limit)
+                ).fetchall()
+        except sqlite3.Error:
+            return []
+        return [ratio for ratio, in reversed(rows)]
+
+    def size(self):
+        with self._lock:
+            return self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM solutions").fetchone()[0]
+
+    def clear(self):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM solutions")
+            self._conn.execute("DELETE FROM timings")
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
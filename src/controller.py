@@ -1,21 +1,125 @@
-from PySide2.QtCore import Slot
+from PySide2.QtCore import Slot, Signal, QObject, QRunnable, QThreadPool, QTimer, QModelIndex
 from PySide2.QtWidgets import QMessageBox, QFileDialog
 
+import copy
+import time
+
 import numpy as np
-import math
 import matplotlib.ticker as ticker
 
+from src.model import sample_count
+from src.render import format_si, label_solutions, draw_sweep
+
+# Samples of the immediate first pass, drawn before any refinement
+COARSE_POINTS = 300
+
+# Quiet period after the last keystroke before a live plot update
+LIVE_DEBOUNCE_MS = 250
+
+INFINITE_SOLUTIONS = "There are Infinite number of solutions found"
+
+
+class RefineSignals(QObject):
+    curves = Signal(int, object, object, object)
+    roots = Signal(int, object)
+    finished = Signal(int, object, object)
+
+
+class RefineJob(QRunnable):
+    """Full resolution evaluation and root finding, run off the GUI thread.
+
+    Results are reported through ``signals`` tagged with ``job_id``; roots
+    are streamed chunk by chunk for the numerical method. A cancelled job
+    stops at the next chunk and reports nothing more. ``finished`` carries
+    the time spent finding roots and whether they came from the solution
+    cache, for the cost model.
+    """
+
+    def __init__(self, job_id, model, x_values, method=None):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.job_id = job_id
+        # A private copy keeps fx, gx and intersections stable for this job
+        # while the GUI thread moves on to newer input; the parse and compile
+        # caches stay shared and are guarded by the model's lock
+        self.model = copy.copy(model)
+        self.x_values = x_values
+        self.method = method
+        self.cancelled = False
+        self.stats = {"solve_seconds": None, "cached": False}
+        self.signals = RefineSignals()
+
+    def cancel(self):
+        self.cancelled = True
+
+    def run(self):
+        try:
+            error = self._refine()
+        except Exception as e:
+            error = f"Unable to refine the plot: {str(e)}"
+        if not self.cancelled:
+            self.signals.finished.emit(self.job_id, error, self.stats)
+
+    def _refine(self):
+        y_fx, error = self.model.evaluate(self.model.fx, self.x_values)
+        if error:
+            return error
+        y_gx, error = self.model.evaluate(self.model.gx, self.x_values)
+        if error:
+            return error
+        if self.cancelled:
+            return None
+        self.signals.curves.emit(self.job_id, self.x_values, y_fx, y_gx)
+
+        start = time.perf_counter()
+        if self.method == "Numerical":
+            if self.model.fx == self.model.gx:
+                return INFINITE_SOLUTIONS
+            for roots in self.model.iter_intersections_numerical(self.x_values):
+                if self.cancelled:
+                    return None
+                if roots:
+                    self.signals.roots.emit(self.job_id, roots)
+        elif self.method == "Symbolic":
+            roots, error = self.model.find_intersections_symbolic(self.x_values)
+            self.stats["cached"] = bool(self.model._last_solve_cached)
+            if error:
+                return error
+            if roots and not self.cancelled:
+                self.signals.roots.emit(self.job_id, list(roots))
+        self.stats["solve_seconds"] = time.perf_counter() - start
+        return None
+
+
 class MainController:
     def __init__(self, model, view):
         self.model = model
         self.view = view
         self.ax = self.view.figure.gca()
+        self._solution_markers = None
+        self._solution_labels = []
+        self._solution_cids = None
+        self._fx_line = None
+        self._gx_line = None
+        self._thread_pool = QThreadPool.globalInstance()
+        self._job = None
+        self._job_id = 0
+        self._job_context = None
+        self._live_timer = QTimer()
+        self._live_timer.setSingleShot(True)
+        self._live_timer.setInterval(LIVE_DEBOUNCE_MS)
+        self._live_timer.timeout.connect(self.live_update)
         self.view.solve_btn.clicked.connect(self.solve)
         self.view.reset_btn.clicked.connect(self.reset)
         self.view.fx_plot_btn.clicked.connect(self.plot_fx)
         self.view.gx_plot_btn.clicked.connect(self.plot_gx)
         self.view.fit_btn.clicked.connect(self.fit_to_solution)
+        self.view.sweep_btn.clicked.connect(self.sweep)
         self.view.save_action.triggered.connect(self.save_solution)
+        self.view.solutions_list.clicked.connect(self.zoom_to_solution)
+        self.view.fx_input.textEdited.connect(self._schedule_live_update)
+        self.view.gx_input.textEdited.connect(self._schedule_live_update)
+        self.view.live_checkbox.toggled.connect(self._on_live_toggled)
 
     def _validate_range(self):
         try:
@@ -28,15 +132,30 @@ class MainController:
             QMessageBox.warning(self.view, "Input Error", f"Invalid range values: {e}")
             return None, None
 
-    def _plot_functions(self, x_values):
-        y_fx, error = self.model.evaluate(self.model.fx, x_values)
+    def _report_error(self, title, error, live):
+        # Live updates must not interrupt typing with a dialog
+        if live:
+            self.view.status_bar.showMessage(error)
+        else:
+            self.view.status_bar.showMessage(f"{title}: {error}", 5000)
+            QMessageBox.warning(self.view, title, error)
+
+    def _evaluate_coarse(self, func, x_values):
+        # The guarded worker process can take seconds; the refine job does
+        # that evaluation off the GUI thread and fills the curve in then
+        if self.model.needs_guard(func, len(x_values)):
+            return np.full_like(x_values, np.nan), None
+        return self.model.evaluate(func, x_values)
+
+    def _plot_functions(self, x_values, live=False):
+        y_fx, error = self._evaluate_coarse(self.model.fx, x_values)
         if error:
-            QMessageBox.warning(self.view, "Evaluation Error", error)
+            self._report_error("Evaluation Error", error, live)
             return None
             
-        y_gx, error = self.model.evaluate(self.model.gx, x_values)
+        y_gx, error = self._evaluate_coarse(self.model.gx, x_values)
         if error:
-            QMessageBox.warning(self.view, "Evaluation Error", error)
+            self._report_error("Evaluation Error", error, live)
             return None
         
         if np.isscalar(y_fx):
@@ -46,53 +165,27 @@ class MainController:
 
         ax = self.view.figure.gca()
         ax.clear()
+        self._solution_markers = None
+        self._solution_labels = []
+        self._solution_cids = None
+        self._fx_line = None
+        self._gx_line = None
         if y_fx is not None:
-            ax.plot(x_values, y_fx, label="f(x)", color="blue")
+            self._fx_line, = ax.plot(x_values, y_fx, label="f(x)", color="blue")
         if y_gx is not None:
-            ax.plot(x_values, y_gx, label="g(x)", color="red")
+            self._gx_line, = ax.plot(x_values, y_gx, label="g(x)", color="red")
         return ax
     
 
-    def _format_si(self, value, _=1):
-        si_prefixes = [
-            (-18, 'a'), (-15, 'f'), (-12, 'p'), (-9, 'n'),
-            (-6, 'µ'), (-3, 'm'), (0, ''), (3, 'k'),
-            (6, 'M'), (9, 'G'), (12, 'T'), (15, 'P'),
-            (18, 'E'), (21, 'Z'), (24, 'Y')
-        ]
-        if value == 0:
-            return "0 "  # Special case for zero
-
-        abs_value = abs(value)
-        exponent = math.floor(math.log10(abs_value))
-        si_exponent = min(max((exponent // 3) * 3, -18), 24)
-        scaled_value = round(value / 10**si_exponent, 1)
-
-        # Use list indexing for lookup
-        prefix = si_prefixes[(si_exponent + 18) // 3][1]
-
-        return f"{scaled_value:.1f}{prefix}"
-                
     def _get_plot_points(self):
         """Calculate number of points based on range and accuracy setting"""
         try:
             x_min = float(self.view.xmin_input.text())
             x_max = float(self.view.xmax_input.text())
-            range_size = abs(x_max - x_min)
-
             accuracy = self.view.accuracy_combo.currentText()
-
-            # Base number of points for different accuracies
-            points_map = {
-                "Low": 100,
-                "Medium": 500,
-                "High": 1000
-            }
-
-            # Adjust points based on range size
-            base_points = points_map[accuracy]
-            range_factor = max(1, range_size / 20)  # Normalize to a standard range of 20
-            return int(base_points * range_factor)
+            if accuracy == "Auto":
+                return self.model.plan_solve(x_min, x_max, method="Numerical")["points"]
+            return sample_count(x_min, x_max, accuracy)
 
         except ValueError:
             return 1000  # fallback
@@ -132,34 +225,199 @@ class MainController:
             return
             
         num_points = self._get_plot_points()
-        x_values = np.linspace(x_min, x_max, num_points)
-        ax = self._plot_functions(x_values)
-        if ax is None:
+        if self._draw_coarse(x_min, x_max, num_points) is None:
             return
-            
+        self._start_refinement(np.linspace(x_min, x_max, num_points), {"method": None})
+
+    def _draw_coarse(self, x_min, x_max, num_points, live=False):
+        """Draw a cheap first pass right away, before the full resolution one"""
+        self._cancel_refinement()
+        x_values = np.linspace(x_min, x_max, min(COARSE_POINTS, num_points))
+        ax = self._plot_functions(x_values, live)
+        if ax is None:
+            return None
+
         ax.grid()
         ax.legend()
-        ax.xaxis.set_major_formatter(ticker.FuncFormatter(self._format_si))
-        ax.yaxis.set_major_formatter(ticker.FuncFormatter(self._format_si))
-        self.view.canvas.draw()
-        self.view.status_bar.showMessage("Plot updated.", 5000)
+        ax.xaxis.set_major_formatter(ticker.FuncFormatter(format_si))
+        ax.yaxis.set_major_formatter(ticker.FuncFormatter(format_si))
+        if live:
+            # Coalesces with any draw still pending from older input
+            self.view.canvas.draw_idle()
+        else:
+            self.view.canvas.draw()
+        return ax
+
+    def _start_refinement(self, x_values, context):
+        self._job_id += 1
+        self._job_context = dict(context, found=[], start=time.perf_counter())
+        job = RefineJob(self._job_id, self.model, x_values, context["method"])
+        job.signals.curves.connect(self._on_refined_curves)
+        job.signals.roots.connect(self._on_roots_found)
+        job.signals.finished.connect(self._on_refine_finished)
+        self._job = job
+        self._thread_pool.start(job)
+        self.view.status_bar.showMessage(context.get("message", "Refining plot..."))
+
+    def _cancel_refinement(self):
+        if self._job is not None:
+            self._job.cancel()
+            self._job = None
+        self._job_id += 1
+
+    def is_refining(self):
+        return self._job is not None
+
+    @Slot(int, object, object, object)
+    def _on_refined_curves(self, job_id, x_values, y_fx, y_gx):
+        if job_id != self._job_id:
+            return
+        for line, y_values in ((self._fx_line, y_fx), (self._gx_line, y_gx)):
+            if line is None or y_values is None:
+                continue
+            if np.isscalar(y_values):
+                y_values = np.full_like(x_values, y_values)
+            line.set_data(x_values, y_values)
+        # The coarse pass set the limits; peaks it missed must fit too
+        ax = self.view.figure.gca()
+        ax.relim()
+        ax.autoscale_view()
+        self.view.canvas.draw_idle()
+
+    @Slot(int, object)
+    def _on_roots_found(self, job_id, roots):
+        if job_id != self._job_id:
+            return
+        found = self._job_context["found"]
+        found.extend(roots)
+        self.model.intersections = list(found)
+        self.view.solutions_model.append_points(roots)
+        self._annotate_solutions(self.view.figure.gca())
+        self.view.canvas.draw_idle()
+        self.view.status_bar.showMessage(f"{len(found)} intersection points found so far...")
+
+    @Slot(int, object, object)
+    def _on_refine_finished(self, job_id, error, stats):
+        if job_id != self._job_id:
+            return
+        self._job = None
+        context = self._job_context
+        elapsed = time.perf_counter() - context["start"]
+
+        if context["method"] is None:
+            if error:
+                self._report_error("Evaluation Error", error, context.get("live", False))
+                return
+            self.view.status_bar.showMessage("Plot updated.", 5000)
+            return
+
+        if stats["solve_seconds"] is not None and not stats["cached"]:
+            self.model.record_timing(context["method"], context["predicted_seconds"], stats["solve_seconds"])
+        auto_note = context["auto_note"]
+        if auto_note:
+            auto_note += f" Took {elapsed:.2f} s."
+
+        found = context["found"]
+        if error in (INFINITE_SOLUTIONS, "There are infinite solutions"):
+            self.view.solutions_model.set_message("Infinite number of solutions found")
+            self.view.status_bar.showMessage("Infinite number of solutions found" + auto_note, 5000)
+            QMessageBox.information(self.view, "Infinite Solutions", "There are Infinite number of solutions found.")
+        elif error:
+            self._report_error("Solving Error", error, False)
+        elif not found:
+            self.view.solutions_model.set_message("No solutions found.")
+            self.view.status_bar.showMessage("no solutions found" + auto_note, 5000)
+            QMessageBox.information(self.view, "No Intersections", "No intersection points were found.")
+        else:
+            self.view.status_bar.showMessage("Intersection points found and plotted." + auto_note, 5000)
+
+    @Slot(str)
+    def _schedule_live_update(self, _text=None):
+        if not self.view.live_checkbox.isChecked():
+            return
+        # Whatever is still computing is for input that no longer exists
+        self._cancel_refinement()
+        self._live_timer.start()
+
+    @Slot(bool)
+    def _on_live_toggled(self, checked):
+        if checked:
+            self._schedule_live_update()
+        else:
+            self._live_timer.stop()
+
+    @Slot()
+    def live_update(self):
+        """Re-plot from the current inputs without any dialogs"""
+        fx_input = self.view.fx_input.text()
+        gx_input = self.view.gx_input.text()
+        for name, text, setter in (("f(x)", fx_input, self.model.set_fx), ("g(x)", gx_input, self.model.set_gx)):
+            success, error = setter(text if text.strip() else None)
+            if not success:
+                # Keep showing the last valid plot while the input is incomplete
+                self.view.status_bar.showMessage(f"{name}: {error}")
+                return
+        if self.model.fx is None and self.model.gx is None:
+            return
+
+        try:
+            x_min = float(self.view.xmin_input.text())
+            x_max = float(self.view.xmax_input.text())
+        except ValueError:
+            self.view.status_bar.showMessage("Invalid range values.")
+            return
+        if x_min >= x_max:
+            self.view.status_bar.showMessage("X min must be less than X max.")
+            return
+
+        num_points = self._get_plot_points()
+        if self._draw_coarse(x_min, x_max, num_points, live=True) is None:
+            return
+        self._start_refinement(np.linspace(x_min, x_max, num_points), {"method": None, "live": True})
+
+    def _clear_solution_artists(self):
+        for artist in [self._solution_markers] + self._solution_labels:
+            # ax.clear() already detaches artists, removing them again raises
+            if artist is not None and artist.axes is not None:
+                artist.remove()
+        self._solution_markers = None
+        self._solution_labels = []
 
     def _annotate_solutions(self, ax):
-        for x, y in self.model.intersections:
-            ax.plot(x, y, 'ko')
-            ax.annotate(
-                f"({x:.2f}, {y:.2f})",
-                xy=(x, y),
-                textcoords="offset points",
-                xytext=(10, 10),
-                fontsize=10,
-                fontweight='bold',
-                bbox=dict(facecolor="white", alpha=0.7, edgecolor="black", boxstyle="round,pad=0.3"),
-            )
+        self._clear_solution_artists()
+        if self._solution_cids is not None:
+            ax_connected, cids = self._solution_cids
+            for cid in cids:
+                ax_connected.callbacks.disconnect(cid)
+            self._solution_cids = None
+        if not self.model.intersections:
+            return
+
+        points = np.asarray(self.model.intersections, dtype=np.float64).reshape(-1, 2)
+        # A single collection for all markers, however many roots there are
+        self._solution_markers = ax.scatter(points[:, 0], points[:, 1], color='k', s=25, zorder=3)
+        self._update_solution_labels(ax)
+        # Zoom and pan set x and y separately, so both must refresh the labels
+        cids = [
+            ax.callbacks.connect('xlim_changed', self._update_solution_labels),
+            ax.callbacks.connect('ylim_changed', self._update_solution_labels),
+        ]
+        self._solution_cids = (ax, cids)
+
+    def _update_solution_labels(self, ax):
+        for label in self._solution_labels:
+            if label.axes is not None:
+                label.remove()
+        self._solution_labels = []
+        if not self.model.intersections:
+            return
+
+        points = np.asarray(self.model.intersections, dtype=np.float64).reshape(-1, 2)
+        self._solution_labels = label_solutions(ax, points)
 
     @Slot()
     def solve(self):
-        self.view.solutions_list.clear()
+        self.view.solutions_model.clear()
         
         if not self.view.fx_input.text().strip() or not self.view.gx_input.text().strip():
             QMessageBox.warning(self.view, "Input Error", "Please define both f(x) and g(x) before solving.")
@@ -179,45 +437,86 @@ class MainController:
         if x_min is None or x_max is None:
             return
 
-        num_points = self._get_plot_points()
-        x_values = np.linspace(x_min, x_max, num_points)
-        if self.view.method_combo.currentText() == "Symbolic":
-            intersections, error = self.model.find_intersections_symbolic(x_values)
-        elif self.view.method_combo.currentText() == "Numerical":
-            print("numerical")
-            intersections, error = self.model.find_intersections_numerical(x_values)
+        method = self.view.method_combo.currentText()
+        accuracy = self.view.accuracy_combo.currentText()
+        plan = self.model.plan_solve(
+            x_min, x_max,
+            method=None if method == "Auto" else method,
+            accuracy=None if accuracy == "Auto" else accuracy,
+        )
+        auto_note = ""
+        if "Auto" in (method, accuracy):
+            auto_note = (
+                f" Auto: {plan['method']}, {plan['points']:,} points, "
+                f"predicted {plan['predicted_seconds']:.2f} s."
+            )
 
-        
-        if error == "There are Infinite number of solutions found":
-            self.view.solutions_list.addItem("Infinite number of solutions found")
-            QMessageBox.information(self.view, "Infinite Solutions", "There are Infinite number of solutions found.")
-        elif error:
-            QMessageBox.warning(self.view, "Solving Error", error)
+        self.model.intersections = []
+        if self._draw_coarse(x_min, x_max, plan["points"]) is None:
             return
-        elif not intersections:
-            self.view.solutions_list.addItem("No solutions found.")
-            QMessageBox.information(self.view, "No Intersections", "No intersection points were found.")
-        else:
-            for x, y in intersections:
-                self.view.solutions_list.addItem(f"x = {x:.4f}, y = {y:.4f}")
+        self._start_refinement(np.linspace(x_min, x_max, plan["points"]), {
+            "method": plan["method"],
+            "predicted_seconds": plan["predicted_seconds"],
+            "auto_note": auto_note,
+            "message": ("Solving..." + auto_note).strip(),
+        })
 
-        ax = self._plot_functions(x_values)
-        if ax is None:
+
+    def _validate_sweep(self):
+        try:
+            start = float(self.view.sweep_from_input.text())
+            stop = float(self.view.sweep_to_input.text())
+            count = int(self.view.sweep_count_input.text())
+            if count < 2:
+                raise ValueError("Steps must be at least 2.")
+            return np.linspace(start, stop, count)
+        except ValueError as e:
+            QMessageBox.warning(self.view, "Input Error", f"Invalid sweep values: {e}")
+            return None
+
+    @Slot()
+    def sweep(self):
+        self._cancel_refinement()
+        self.view.solutions_model.clear()
+
+        fx_input = self.view.fx_input.text()
+        gx_input = self.view.gx_input.text()
+        if not fx_input.strip() or not gx_input.strip():
+            QMessageBox.warning(self.view, "Input Error", "Please define both f(x) and g(x) before sweeping.")
             return
-            
-        ax.grid()
-        self._annotate_solutions(ax)
-        ax.legend()
-        ax.xaxis.set_major_formatter(ticker.FuncFormatter(self._format_si))
-        ax.yaxis.set_major_formatter(ticker.FuncFormatter(self._format_si))
-        self.view.canvas.draw()
-        if not len(intersections) == 0:
-            self.view.status_bar.showMessage("Intersection points found and plotted.", 5000)
-        elif error == "There are Infinite number of solutions found":
-            self.view.status_bar.showMessage("Infinite number of solutions found", 5000)
-        else: 
-            self.view.status_bar.showMessage("no solutions found", 5000)
 
+        x_min, x_max = self._validate_range()
+        if x_min is None or x_max is None:
+            return
+        parameter_values = self._validate_sweep()
+        if parameter_values is None:
+            return
+
+        parameter = self.view.sweep_param_input.text().strip()
+        # The Auto planner reads the plotted f(x) and g(x), not the sweep's
+        # expressions, so the sweep keeps to the default density there
+        accuracy = self.view.accuracy_combo.currentText()
+        x_values = np.linspace(x_min, x_max, sample_count(x_min, x_max, "Medium" if accuracy == "Auto" else accuracy))
+        table, error = self.model.find_intersections_sweep(fx_input, gx_input, parameter, parameter_values, x_values)
+        if error:
+            QMessageBox.warning(self.view, "Sweep Error", error)
+            return
+
+        if len(table):
+            self.view.solutions_model.set_points(table, headers=(parameter, "x", "y"))
+        else:
+            self.view.solutions_model.set_message("No solutions found.")
+
+        ax = self.view.figure.gca()
+        ax.clear()
+        self._solution_markers = None
+        self._solution_labels = []
+        self._solution_cids = None
+        draw_sweep(ax, table, parameter)
+        self.view.canvas.draw()
+        self.view.status_bar.showMessage(
+            f"Found {len(table)} roots over {len(parameter_values)} values of {parameter}.", 5000
+        )
 
     @Slot()
     def fit_to_solution(self):
@@ -234,18 +533,34 @@ class MainController:
             self.view.canvas.draw()
             self.view.status_bar.showMessage("Fitted view to solution points.", 5000)
 
+    @Slot(QModelIndex)
+    def zoom_to_solution(self, index):
+        point = self.view.solutions_model.point(index.row())
+        if point is None:
+            return
+
+        x, y = point[0], point[1]
+        self.ax.set_xlim(x - 2, x + 2)
+        self.ax.set_ylim(y - 2, y + 2)
+        self.view.canvas.draw()
+        self.view.status_bar.showMessage(f"Zoomed to ({x:.4f}, {y:.4f}).", 5000)
+
     @Slot()
     def reset(self):
+        self._cancel_refinement()
         self.view.fx_input.clear()
         self.view.gx_input.clear()
         self.view.xmin_input.setText("-10")
         self.view.xmax_input.setText("10")
-        self.view.solutions_list.clear()    
+        self.view.solutions_model.clear()
         self.model.set_fx(None)
         self.model.set_gx(None)
         self.model.intersections = []     
         ax = self.view.figure.gca()
         ax.clear()
+        self._solution_markers = None
+        self._solution_labels = []
+        self._solution_cids = None
         ax.grid()        
         self.view.canvas.draw()  
         self.view.status_bar.showMessage("Reset complete.", 5000)
@@ -259,7 +574,7 @@ class MainController:
             self.view, 
             "Save Plot", 
             "", 
-            "PNG Files (*.png);;All Files (*)"
+            "PNG Files (*.png);;SVG Files (*.svg);;PDF Files (*.pdf);;All Files (*)"
         )
         
         # Check if a file path was selected
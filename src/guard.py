@@ -0,0 +1,95 @@
+"""Run risky computations in a child process under CPU and memory limits.
+
+A pathological expression can make SymPy or a lambdified function spin or
+allocate without bound. ``run_limited`` moves such a call into a worker
+process with ``RLIMIT_CPU`` and ``RLIMIT_AS`` applied, so the worst case
+is a ``ResourceLimitError`` instead of a stalled application.
+"""
+import multiprocessing
+import signal
+
+try:
+    import resource
+except ImportError:  # Windows: only the wall-clock timeout applies
+    resource = None
+
+DEFAULT_CPU_SECONDS = 10
+DEFAULT_MEMORY_BYTES = 2 * 1024 ** 3
+
+_context = None
+
+
+class ResourceLimitError(RuntimeError):
+    pass
+
+
+def _get_context():
+    # forkserver children are forked from a clean single-threaded server,
+    # which is safe even though the GUI process runs threads
+    global _context
+    if _context is None:
+        if "forkserver" in multiprocessing.get_all_start_methods():
+            _context = multiprocessing.get_context("forkserver")
+            _context.set_forkserver_preload(["numpy", "sympy"])
+        else:
+            _context = multiprocessing.get_context("spawn")
+    return _context
+
+
+def _worker(conn, func, args, cpu_seconds, memory_bytes):
+    if resource is not None:
+        resource.setrlimit(resource.RLIMIT_CPU, (cpu_seconds, cpu_seconds + 1))
+        try:
+            resource.setrlimit(resource.RLIMIT_AS, (memory_bytes, memory_bytes))
+        except (ValueError, OSError):
+            pass  # not enforceable on every platform
+    try:
+        result = (True, func(*args))
+    except MemoryError:
+        result = (False, "memory limit exceeded")
+    except Exception as e:
+        result = (False, str(e))
+    try:
+        conn.send(result)
+    except MemoryError:
+        conn.send((False, "memory limit exceeded"))
+    finally:
+        conn.close()
+
+
+def run_limited(func, args=(), cpu_seconds=DEFAULT_CPU_SECONDS, memory_bytes=DEFAULT_MEMORY_BYTES, timeout=None):
+    """Call ``func(*args)`` in a worker process and return its result.
+
+    ``func`` and its arguments must be picklable. Raises
+    ``ResourceLimitError`` when the call exceeds ``cpu_seconds`` of CPU
+    time, ``memory_bytes`` of address space or the wall-clock ``timeout``
+    (twice the CPU budget by default), or raises in the worker.
+    """
+    context = _get_context()
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(
+        target=_worker, args=(sender, func, args, cpu_seconds, memory_bytes), daemon=True
+    )
+    process.start()
+    sender.close()
+
+    timeout = cpu_seconds * 2 if timeout is None else timeout
+    try:
+        if not receiver.poll(timeout):
+            raise ResourceLimitError("time limit exceeded")
+        try:
+            ok, value = receiver.recv()
+        except EOFError:
+            process.join(1)
+            if resource is not None and process.exitcode in (-signal.SIGXCPU, -signal.SIGKILL):
+                raise ResourceLimitError("CPU time limit exceeded")
+            raise ResourceLimitError(f"worker exited with code {process.exitcode}")
+    finally:
+        receiver.close()
+        if process.is_alive():
+            process.kill()
+        process.join()
+
+    if not ok:
+        raise ResourceLimitError(value)
+    return value
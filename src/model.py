@@ -1,14 +1,205 @@
-from sympy import symbols, sympify, lambdify, solve, exp, pi
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import math
+import os
+import threading
+
+from sympy import symbols, sympify, lambdify, solve, exp, pi, count_ops, Function, Pow, S
+from sympy import factorial, factorial2, gamma
+from sympy.functions.elementary.trigonometric import TrigonometricFunction
 import numpy as np
 from scipy.optimize import brentq
 
+from src.guard import run_limited
+
+# Base number of sample points for each accuracy setting
+POINTS_MAP = {
+    "Low": 100,
+    "Medium": 500,
+    "High": 1000
+}
+
+# Starting points of the solve cost model, corrected by measured timings
+NUMERICAL_SECONDS_PER_POINT = 5e-4
+SYMBOLIC_BASE_SECONDS = 0.02
+TRANSCENDENTAL_SYMBOLIC_PENALTY = 100
+SAMPLES_PER_PERIOD = 20
+MAX_AUTO_POINTS = 100000
+TIMING_HISTORY = 50
+
+# Grids smaller than this are evaluated in one call; below it the thread
+# hand-off costs more than the ufuncs save by running in parallel
+PARALLEL_MIN_POINTS = 200000
+EVAL_THREADS = os.cpu_count() or 1
+COMPILE_CACHE_SIZE = 64
+
+# Expressions beyond these limits are rejected when parsed
+MAX_EXPRESSION_DEPTH = 100
+MAX_EXPRESSION_NODES = 5000
+MAX_RESULT_DIGITS = 100000
+
+# Expressions beyond these are solved, and evaluated on grids larger than
+# any that already passed, in a worker process under CPU and memory limits
+RISKY_EXPRESSION_DEPTH = 40
+RISKY_EXPRESSION_NODES = 500
+RISKY_RESULT_DIGITS = 300
+GUARD_CPU_SECONDS = 10
+GUARD_MEMORY_BYTES = 2 * 1024 ** 3
+
+_eval_executor = None
+_eval_executor_lock = threading.Lock()
+
+
+def _get_eval_executor():
+    global _eval_executor
+    with _eval_executor_lock:
+        if _eval_executor is None:
+            _eval_executor = ThreadPoolExecutor(max_workers=EVAL_THREADS, thread_name_prefix="evaluate")
+        return _eval_executor
+
+
+def sample_count(x_min, x_max, accuracy):
+    """Number of sample points for a range and accuracy setting"""
+    range_factor = max(1, abs(x_max - x_min) / 20)  # Normalize to a standard range of 20
+    return int(POINTS_MAP[accuracy] * range_factor)
+
+
+def _magnitude(expr):
+    """Upper bound on log10|value| of a constant expression"""
+    if expr.is_Integer:
+        return math.log10(abs(int(expr))) if expr else 0.0
+    if expr.is_Rational:
+        return max(_magnitude(S(expr.p)), _magnitude(S(expr.q)))
+    if expr.is_Float:
+        # From the binary exponent, since float() under- or overflows
+        # outside the double range (1e-400, 1e400)
+        _, mantissa, exponent, bits = expr._mpf_
+        return (exponent + bits) * math.log10(2) if mantissa else 0.0
+    if expr.is_NumberSymbol or expr is S.ImaginaryUnit:
+        return 1.0
+    if expr.is_Pow:
+        exponent = _magnitude(expr.exp)
+        if exponent > 300:
+            return math.inf
+        return max(_magnitude(expr.base), 0.0) * 10 ** exponent
+    if isinstance(expr, exp):
+        argument = _magnitude(expr.args[0])
+        return math.inf if argument > 300 else 10 ** argument * math.log10(math.e)
+    if isinstance(expr, (factorial, factorial2, gamma)):
+        argument = _magnitude(expr.args[0])
+        if argument > 300:
+            return math.inf
+        n = 10 ** argument
+        return n * max(math.log10(n), 1.0)
+    if expr.is_Mul:
+        return sum(max(_magnitude(arg), 0.0) for arg in expr.args)
+    if expr.is_Add:
+        return max(_magnitude(arg) for arg in expr.args) + math.log10(len(expr.args))
+    if expr.args:
+        return max(_magnitude(arg) for arg in expr.args)
+    return 0.0
+
+
+def expression_cost(expr):
+    """Tree depth, node count and largest constant size (in decimal digits) of ``expr``"""
+    depth = nodes = 0
+    digits = 0.0
+    stack = [(expr, 1)]
+    while stack:
+        node, level = stack.pop()
+        nodes += 1
+        depth = max(depth, level)
+        if not node.free_symbols and node.args:
+            # Constant subtrees are what lambdify and solve compute exactly
+            digits = max(digits, _magnitude(node))
+        elif node.is_Integer:
+            digits = max(digits, _magnitude(node))
+        stack.extend((arg, level + 1) for arg in node.args)
+    return {"depth": depth, "nodes": nodes, "digits": digits}
+
+
+def _degree_bound(expr, x):
+    """Upper bound on the degree of a polynomial in ``x``, without expanding it"""
+    if not expr.has(x):
+        return 0
+    if expr == x:
+        return 1
+    if expr.is_Add:
+        return max(_degree_bound(arg, x) for arg in expr.args)
+    if expr.is_Mul:
+        return sum(_degree_bound(arg, x) for arg in expr.args)
+    if expr.is_Pow and expr.exp.is_Integer and expr.exp >= 0:
+        return _degree_bound(expr.base, x) * int(expr.exp)
+    return None
+
+
+def _solve_worker(expr, x):
+    return solve(expr, x)
+
+
+def _evaluate_worker(expr, x, x_values):
+    return lambdify(x, expr, "numpy")(x_values)
+
+
+def _sweep_worker(fx, gx, param, x, p_vals, x_vals, tol):
+    """Roots of fx = gx over the (parameter x x) grid, as (parameter, x, y) columns"""
+    diff_func = lambdify((param, x), fx - gx, "numpy")
+    fx_func = lambdify((param, x), fx, "numpy")
+    with np.errstate(all='ignore'):
+        grid = np.broadcast_to(diff_func(p_vals[:, None], x_vals[None, :]), (p_vals.size, x_vals.size))
+        grid = np.where(np.isfinite(grid), grid, np.nan)
+
+        # Brackets where the sign flips between neighbouring samples
+        rows, cols = np.nonzero(grid[:, :-1] * grid[:, 1:] < 0)
+        p, lo, hi = p_vals[rows], x_vals[cols], x_vals[cols + 1]
+        f_lo, f_hi = grid[rows, cols], grid[rows, cols + 1]
+        bound = np.maximum(np.abs(f_lo), np.abs(f_hi))
+
+        if len(p):
+            steps = int(np.clip(np.ceil(np.log2(np.max(hi - lo) / tol)), 1, 100))
+            for _ in range(steps):
+                mid = (lo + hi) / 2
+                f_mid = np.broadcast_to(diff_func(p, mid), mid.shape)
+                left = np.sign(f_mid) == np.sign(f_lo)
+                lo = np.where(left, mid, lo)
+                f_lo = np.where(left, f_mid, f_lo)
+                hi = np.where(left, hi, mid)
+        roots = (lo + hi) / 2
+
+        # A sign change across a pole converges to a huge residual
+        residual = np.abs(np.broadcast_to(diff_func(p, roots), roots.shape))
+        keep = residual <= bound
+        p, roots = p[keep], roots[keep]
+
+        # Samples landing exactly on a root
+        zero_rows, zero_cols = np.nonzero(grid == 0)
+        p = np.concatenate([p, p_vals[zero_rows]])
+        roots = np.concatenate([roots, x_vals[zero_cols]])
+
+        y = np.broadcast_to(fx_func(p, roots), roots.shape).astype(np.float64)
+    return p, roots, y
+
+
 class FunctionModel:
-    def __init__(self):
+    def __init__(self, solution_cache=None):
         self.x = symbols('x')
         self.locals = {"x": self.x, "X": self.x, "e": exp(1), "E": exp(1), "pi": pi}
         self.fx = None       
         self.gx = None 
         self.intersections = []
+        self.sweep_results = np.empty((0, 3))
+        self.solution_cache = solution_cache
+        self._timings = {}
+        self._parsed = {}
+        self._compiled = {}
+        self._risky = {}
+        self._cleared = {}
+        # Shared with the copies solving in background threads, whose cache
+        # and timing updates race with the GUI thread's
+        self._cache_lock = threading.RLock()
+        self.eval_threads = EVAL_THREADS
+        self.parallel_min_points = PARALLEL_MIN_POINTS
+        self._last_solve_cached = False
   
     def set_fx(self, expression):
         if expression is None:
@@ -48,24 +239,130 @@ class FunctionModel:
         if func is None:
             return None, None
         try:
-            x_vals = np.array(x_values)
-            func_lambda = lambdify(self.x, func, "numpy")
+            x_vals = np.asarray(x_values)
+            if self.needs_guard(func, x_vals.size):
+                y_vals = run_limited(
+                    _evaluate_worker, (func, self.x, x_vals), GUARD_CPU_SECONDS, GUARD_MEMORY_BYTES
+                )
+                self._remember(self._cleared, func, x_vals.size)
+                return y_vals, None
+            func_lambda = self._compile(func)
+            if x_vals.ndim == 1 and x_vals.size >= self.parallel_min_points and self.eval_threads > 1:
+                return self._evaluate_parallel(func_lambda, x_vals), None
             return func_lambda(x_vals), None
         except Exception as e:
             return None, f"Error evaluating function: {str(e)}"
 
-    def _parse_expression(self, expression):
-        expr = sympify(expression, convert_xor=True, evaluate=False, locals=self.locals)
-        allowed_symbols = {self.x} 
+    def _remember(self, cache, key, value):
+        """Store ``value`` in one of the bounded caches, evicting the oldest entry"""
+        with self._cache_lock:
+            if key not in cache and len(cache) >= COMPILE_CACHE_SIZE:
+                cache.pop(next(iter(cache)))
+            cache[key] = value
+
+    def _compile(self, func):
+        with self._cache_lock:
+            func_lambda = self._compiled.get(func)
+        if func_lambda is None:
+            func_lambda = lambdify(self.x, func, "numpy")
+            self._remember(self._compiled, func, func_lambda)
+        return func_lambda
+
+    def _evaluate_parallel(self, func_lambda, x_vals):
+        # A two-sample probe gives the output dtype, and shows constant
+        # functions, which come back as scalars
+        probe = np.asarray(func_lambda(x_vals[:2]))
+        if probe.ndim == 0:
+            return func_lambda(x_vals)
+
+        out = np.empty(x_vals.size, dtype=probe.dtype)
+        workers = max(2, min(self.eval_threads, x_vals.size // max(1, self.parallel_min_points // 2)))
+        bounds = np.linspace(0, x_vals.size, workers + 1).astype(int)
+
+        # Each slice is written in place, so no concatenation copy is needed
+        def evaluate_slice(i):
+            out[bounds[i]:bounds[i + 1]] = func_lambda(x_vals[bounds[i]:bounds[i + 1]])
+
+        futures = [_get_eval_executor().submit(evaluate_slice, i) for i in range(1, workers)]
+        evaluate_slice(0)
+        for future in futures:
+            future.result()
+        return out
+
+    def _parse_expression(self, expression, parameters=()):
+        key = (expression, tuple(parameters))
+        with self._cache_lock:
+            expr = self._parsed.get(key)
+        if expr is None:
+            expr = self._parse_uncached(expression, parameters)
+            self._remember(self._parsed, key, expr)
+        return expr
+
+    def _parse_uncached(self, expression, parameters):
+        local_symbols = dict(self.locals, **{str(p): p for p in parameters})
+        expr = sympify(expression, convert_xor=True, evaluate=False, locals=local_symbols)
+        allowed_symbols = {self.x, *parameters}
         used_symbols = expr.free_symbols
         invalid_symbols = used_symbols - allowed_symbols
         
         if invalid_symbols:
             invalid_symbols_str = ', '.join(str(sym) for sym in invalid_symbols)
-            raise ValueError(f"Unknown symbol(s) used: {invalid_symbols_str}. Please use 'x' as the variable.")
+            allowed_str = ' and '.join(f"'{sym}'" for sym in [self.x, *parameters])
+            plural = 's' if parameters else ''
+            raise ValueError(f"Unknown symbol(s) used: {invalid_symbols_str}. Please use {allowed_str} as the variable{plural}.")
+
+        cost = expression_cost(expr)
+        if cost["depth"] > MAX_EXPRESSION_DEPTH or cost["nodes"] > MAX_EXPRESSION_NODES:
+            raise ValueError("Expression is too large to evaluate safely.")
+        if cost["digits"] > MAX_RESULT_DIGITS:
+            raise ValueError("Expression contains numbers too large to evaluate safely.")
         
         return expr
 
+    def needs_guard(self, func, size):
+        """Whether evaluating ``func`` on ``size`` points must run under the resource limits.
+
+        Evaluation time and memory grow with the number of points, so once
+        a risky expression stayed within the limits on some grid, smaller
+        grids, such as the scalar calls of the root finders, run in-process.
+        """
+        if func is None or not self._is_risky(func):
+            return False
+        with self._cache_lock:
+            return size > self._cleared.get(func, -1)
+
+    def _is_risky(self, expr):
+        with self._cache_lock:
+            risky = self._risky.get(expr)
+        if risky is None:
+            cost = expression_cost(expr)
+            risky = (
+                cost["depth"] > RISKY_EXPRESSION_DEPTH
+                or cost["nodes"] > RISKY_EXPRESSION_NODES
+                or cost["digits"] > RISKY_RESULT_DIGITS
+            )
+            self._remember(self._risky, expr, risky)
+        return risky
+
+    def _solve_symbolic(self, expr):
+        self._last_solve_cached = False
+        if self.solution_cache is None:
+            return self._solve_guarded(expr)
+
+        key = self.solution_cache.key(expr)
+        roots = self.solution_cache.get(key)
+        if roots is None:
+            roots = self._solve_guarded(expr)
+            self.solution_cache.put(key, roots)
+        else:
+            self._last_solve_cached = True
+        return roots
+
+    def _solve_guarded(self, expr):
+        if self._is_risky(expr):
+            return run_limited(_solve_worker, (expr, self.x), GUARD_CPU_SECONDS, GUARD_MEMORY_BYTES)
+        return solve(expr, self.x)
+
     def find_intersections_symbolic(self, x_vals):
         self.intersections = []
         if self.fx is None or self.gx is None:
@@ -77,7 +374,7 @@ class FunctionModel:
         x_min, x_max = np.min(x_vals), np.max(x_vals)
         
         try:
-            symbolic_roots = solve(self.fx - self.gx, self.x)
+            symbolic_roots = self._solve_symbolic(self.fx - self.gx)
             symbolic_roots = [sol for sol in symbolic_roots if sol.is_real]
             
             for root in symbolic_roots:
@@ -99,6 +396,20 @@ class FunctionModel:
         if self.fx == self.gx:
             return [], "There are infinite solutions"
 
+        for roots in self.iter_intersections_numerical(x_vals, tol):
+            self.intersections.extend(roots)
+        return self.intersections, None
+
+    def iter_intersections_numerical(self, x_vals, tol=1e-6, chunk_size=2000):
+        """Yield the roots found in each chunk of ``x_vals``, left to right.
+
+        Neighbouring chunks share their boundary sample so no sign change
+        is missed. Unlike ``find_intersections_numerical`` this does not
+        touch ``self.intersections``.
+        """
+        if self.fx is None or self.gx is None or self.fx == self.gx:
+            return
+
         x_vals = np.array(x_vals, dtype=np.float64)
         x_min, x_max = x_vals.min(), x_vals.max()
 
@@ -109,23 +420,178 @@ class FunctionModel:
             gx = gx[0] if isinstance(gx, (list, tuple, np.ndarray)) else gx
             return fx - gx
 
-        diff_vals = np.array([diff_func(x) for x in x_vals])
-        sign_changes = np.where(np.diff(np.sign(diff_vals)))[0]
-
-        for i in sign_changes:
-            x_left, x_right = x_vals[i], x_vals[i + 1]
-            try:
-                root = brentq(diff_func, x_left, x_right, xtol=tol)
-                if x_min - 1e-9 <= root <= x_max + 1e-9:
-                    y_root = self.evaluate(self.fx, root)
-                    y_root = y_root[0] if isinstance(y_root, (list, tuple, np.ndarray)) else y_root
-                    if y_root is not None and not np.isnan(y_root):
-                        self.intersections.append((root, y_root))
-            except ValueError:
-                continue
+        for start in range(0, max(len(x_vals) - 1, 1), chunk_size):
+            chunk = x_vals[start:start + chunk_size + 1]
+            diff_vals = np.array([diff_func(x) for x in chunk])
+            sign_changes = np.where(np.diff(np.sign(diff_vals)))[0]
 
-        return self.intersections, None
+            roots = []
+            for i in sign_changes:
+                x_left, x_right = chunk[i], chunk[i + 1]
+                try:
+                    root = brentq(diff_func, x_left, x_right, xtol=tol)
+                    if x_min - 1e-9 <= root <= x_max + 1e-9:
+                        y_root = self.evaluate(self.fx, root)
+                        y_root = y_root[0] if isinstance(y_root, (list, tuple, np.ndarray)) else y_root
+                        if y_root is not None and not np.isnan(y_root):
+                            roots.append((root, y_root))
+                except ValueError:
+                    continue
+            yield roots
+
+
+    def find_intersections_sweep(self, fx_expr, gx_expr, parameter, parameter_values, x_vals, tol=1e-9):
+        """Intersections of f(x) and g(x) for every value of a parameter.
+
+        The expressions may use ``parameter`` besides x. The whole
+        (parameter x x) grid is evaluated as one broadcast array, sign
+        changes are found along x and all brackets are bisected together,
+        under the resource limits when the expressions are risky. Returns an (N, 3) array of (parameter, x, y) rows sorted by
+        parameter then x, and an error message.
+        """
+        self.intersections = []
+        self.sweep_results = np.empty((0, 3))
+        if not parameter.isidentifier() or parameter in self.locals:
+            return self.sweep_results, f"Invalid parameter name: {parameter!r}."
+
+        param = symbols(parameter)
+        try:
+            fx = self._parse_expression(fx_expr, (param,))
+            gx = self._parse_expression(gx_expr, (param,))
+        except Exception as e:
+            return self.sweep_results, f"Error parsing expression: {str(e)}"
+        if fx == gx:
+            return self.sweep_results, "There are Infinite number of solutions found"
+
+        p_vals = np.asarray(parameter_values, dtype=np.float64).ravel()
+        x_vals = np.asarray(x_vals, dtype=np.float64).ravel()
+        args = (fx, gx, param, self.x, p_vals, x_vals, tol)
+        try:
+            if self._is_risky(fx - gx):
+                p, roots, y = run_limited(_sweep_worker, args, GUARD_CPU_SECONDS, GUARD_MEMORY_BYTES)
+            else:
+                p, roots, y = _sweep_worker(*args)
+        except Exception as e:
+            return self.sweep_results, f"Error evaluating function: {str(e)}"
+
+        valid = ~np.isnan(y)
+        table = np.column_stack([p[valid], roots[valid], y[valid]])
+        self.sweep_results = table[np.lexsort((table[:, 1], table[:, 0]))]
+        return self.sweep_results, None
+
+    def _cost_expression(self):
+        if self.fx is not None and self.gx is not None:
+            return self.fx - self.gx
+        if self.fx is not None:
+            return self.fx
+        if self.gx is not None:
+            return self.gx
+        return S.Zero
+
+    def expression_features(self, x_min, x_max):
+        """Features of f(x) - g(x) that drive the solve cost model"""
+        expr = self._cost_expression()
+
+        transcendental = [f for f in expr.atoms(Function) if f.has(self.x)]
+        transcendental += [p for p in expr.atoms(Pow) if p.exp.has(self.x)]
+
+        # Fastest oscillation among trig terms with a linear argument
+        frequency = 0.0
+        for term in expr.atoms(TrigonometricFunction):
+            slope = term.args[0].diff(self.x)
+            if slope.is_number and slope.is_real:
+                frequency = max(frequency, abs(float(slope)))
+
+        # Bounded from the expression tree: Poly() would expand (x+1)^5000
+        # and take longer than the solve being planned
+        degree = None
+        if not transcendental and expr.is_polynomial(self.x):
+            degree = _degree_bound(expr, self.x)
+
+        return {
+            "ops": int(count_ops(expr)),
+            "degree": degree,
+            "transcendental": len(transcendental),
+            "frequency": frequency,
+            "width": abs(x_max - x_min),
+        }
+
+    def estimate_cost(self, method, features, points):
+        """Predicted solve time in seconds for a method and sample count"""
+        if method == "Numerical":
+            base = NUMERICAL_SECONDS_PER_POINT * points * (1 + features["ops"] / 20)
+        else:
+            base = SYMBOLIC_BASE_SECONDS * (1 + features["ops"] / 5) ** 2
+            if features["degree"] is not None:
+                base *= max(1, features["degree"] - 3)
+            base *= TRANSCENDENTAL_SYMBOLIC_PENALTY ** min(features["transcendental"], 3)
+        return base * self._timing_correction(method)
+
+    def plan_solve(self, x_min, x_max, method=None, accuracy=None):
+        """Pick the solve method and sample count, leaving given choices as they are.
+
+        The sample count resolves the fastest oscillation with
+        SAMPLES_PER_PERIOD points per period, capped at MAX_AUTO_POINTS.
+        Symbolic solving is only considered for algebraic equations, since
+        SymPy cannot mix polynomials with transcendental terms and only
+        returns principal roots of periodic ones. When both choices are
+        given nothing is planned, and ``predicted_seconds`` and ``features``
+        are None.
+        """
+        if method is not None and accuracy is not None:
+            return {
+                "method": method,
+                "points": sample_count(x_min, x_max, accuracy),
+                "predicted_seconds": None,
+                "features": None,
+            }
+
+        features = self.expression_features(x_min, x_max)
+        if accuracy is None:
+            periods = features["width"] * features["frequency"] / (2 * math.pi)
+            points = max(sample_count(x_min, x_max, "Medium"), int(periods * SAMPLES_PER_PERIOD))
+            points = min(points, MAX_AUTO_POINTS)
+        else:
+            points = sample_count(x_min, x_max, accuracy)
+
+        if method is None:
+            candidates = ["Numerical"]
+            if features["transcendental"] == 0:
+                candidates.append("Symbolic")
+            method = min(candidates, key=lambda m: self.estimate_cost(m, features, points))
+
+        return {
+            "method": method,
+            "points": points,
+            "predicted_seconds": self.estimate_cost(method, features, points),
+            "features": features,
+        }
+
+    def record_timing(self, method, predicted, seconds):
+        """Feed a measured solve time, excluding cache hits, back into the cost model"""
+        if not predicted:
+            return
+        ratio = seconds / predicted
+        with self._cache_lock:
+            self._timing_ratios(method).append(ratio)
+        if self.solution_cache is not None:
+            self.solution_cache.record_timing(method, ratio)
+
+    def _timing_ratios(self, method):
+        with self._cache_lock:
+            if method not in self._timings:
+                history = []
+                if self.solution_cache is not None:
+                    history = self.solution_cache.timing_ratios(method, TIMING_HISTORY)
+                self._timings[method] = deque(history, maxlen=TIMING_HISTORY)
+            return self._timings[method]
 
+    def _timing_correction(self, method):
+        with self._cache_lock:
+            ratios = list(self._timing_ratios(method))
+        if not ratios:
+            return 1.0
+        return float(np.median(ratios))
 
     def get_intersection_view_bounds(self):
         if not self.intersections:
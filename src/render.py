@@ -0,0 +1,239 @@
+"""Offscreen Agg rendering of solved plots, independent of the Qt GUI.
+
+Figures are drawn on plain ``matplotlib.figure.Figure`` objects, so this
+module works without a display or a ``QApplication`` and can be driven
+from scripts or worker processes::
+
+    from src.render import export_batch
+
+    results = export_batch([
+        {"fx": "x^2", "gx": "log10(x)", "x_min": 0.1, "x_max": 10, "path": "out/a.png"},
+        {"fx": "sin(x)", "gx": "0", "x_min": -10, "x_max": 10, "path": "out/b.pdf"},
+    ])
+
+The output format follows the file extension (PNG, SVG, PDF, ...).
+"""
+import argparse
+import json
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import matplotlib.ticker as ticker
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+from src.model import POINTS_MAP, FunctionModel
+
+# Upper bounds on the text artists drawn for intersection labels
+MAX_BOXED_LABELS = 20
+MAX_LABELS = 50
+
+
+def format_si(value, _=1):
+    si_prefixes = [
+        (-18, 'a'), (-15, 'f'), (-12, 'p'), (-9, 'n'),
+        (-6, 'µ'), (-3, 'm'), (0, ''), (3, 'k'),
+        (6, 'M'), (9, 'G'), (12, 'T'), (15, 'P'),
+        (18, 'E'), (21, 'Z'), (24, 'Y')
+    ]
+    if value == 0:
+        return "0 "  # Special case for zero
+
+    abs_value = abs(value)
+    exponent = math.floor(math.log10(abs_value))
+    si_exponent = min(max((exponent // 3) * 3, -18), 24)
+    scaled_value = round(value / 10**si_exponent, 1)
+
+    # Use list indexing for lookup
+    prefix = si_prefixes[(si_exponent + 18) // 3][1]
+
+    return f"{scaled_value:.1f}{prefix}"
+
+
+def label_solutions(ax, points):
+    """Annotate the points inside the current view and return the labels"""
+    x_lo, x_hi = sorted(ax.get_xlim())
+    y_lo, y_hi = sorted(ax.get_ylim())
+    visible = points[
+        (points[:, 0] >= x_lo) & (points[:, 0] <= x_hi)
+        & (points[:, 1] >= y_lo) & (points[:, 1] <= y_hi)
+    ]
+
+    # Level of detail: boxed labels for a few roots, a plain evenly spaced
+    # subset when crowded, so the number of text artists stays bounded
+    if len(visible) <= MAX_BOXED_LABELS:
+        bbox = dict(facecolor="white", alpha=0.7, edgecolor="black", boxstyle="round,pad=0.3")
+    else:
+        bbox = None
+        if len(visible) > MAX_LABELS:
+            visible = visible[np.linspace(0, len(visible) - 1, MAX_LABELS).astype(int)]
+
+    return [
+        ax.annotate(
+            f"({x:.2f}, {y:.2f})",
+            xy=(x, y),
+            textcoords="offset points",
+            xytext=(10, 10),
+            fontsize=10,
+            fontweight='bold' if bbox else 'normal',
+            bbox=bbox,
+        )
+        for x, y in visible
+    ]
+
+
+def draw_solution(ax, x_values, y_fx, y_gx, points):
+    """Draw f(x), g(x) and their intersection points on ``ax``"""
+    if y_fx is not None:
+        ax.plot(x_values, y_fx, label="f(x)", color="blue")
+    if y_gx is not None:
+        ax.plot(x_values, y_gx, label="g(x)", color="red")
+    ax.grid()
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    if len(points):
+        ax.scatter(points[:, 0], points[:, 1], color='k', s=25, zorder=3)
+        label_solutions(ax, points)
+    ax.legend()
+    ax.xaxis.set_major_formatter(ticker.FuncFormatter(format_si))
+    ax.yaxis.set_major_formatter(ticker.FuncFormatter(format_si))
+
+
+def draw_sweep(ax, table, parameter):
+    """Plot the roots x of a parameter sweep against the parameter"""
+    table = np.asarray(table, dtype=np.float64).reshape(-1, 3)
+    ax.scatter(table[:, 0], table[:, 1], color='k', s=8, zorder=3)
+    ax.set_xlabel(parameter)
+    ax.set_ylabel("x")
+    ax.set_title("Roots of f(x) = g(x)")
+    ax.grid()
+    ax.xaxis.set_major_formatter(ticker.FuncFormatter(format_si))
+    ax.yaxis.set_major_formatter(ticker.FuncFormatter(format_si))
+
+
+REQUIRED_JOB_KEYS = ("fx", "gx", "x_min", "x_max", "path")
+METHODS = ("Symbolic", "Numerical", "Auto")
+
+
+def render_job(job):
+    """Solve one job and save its figure to ``job["path"]``.
+
+    A job is a dict with the keys ``fx``, ``gx``, ``x_min``, ``x_max`` and
+    ``path``, and optionally ``method`` ("Symbolic", "Numerical" or "Auto"),
+    ``accuracy`` ("Low", "Medium", "High" or "Auto"), ``figsize`` and ``dpi``.
+    Returns a ``(path, error)`` tuple; a bad job never raises, so one
+    failure does not abort a batch.
+    """
+    path = job.get("path") if isinstance(job, dict) else None
+    try:
+        return path, _render_job(job)
+    except Exception as e:
+        return path, f"Could not render the plot: {str(e)}"
+
+
+def _render_job(job):
+    if not isinstance(job, dict):
+        return "A render job must be a JSON object."
+    missing = [key for key in REQUIRED_JOB_KEYS if key not in job]
+    if missing:
+        return f"Missing job keys: {', '.join(missing)}."
+    method = job.get("method", "Symbolic")
+    accuracy = job.get("accuracy", "Medium")
+    if method not in METHODS:
+        return f"Unknown method: {method}."
+    if accuracy != "Auto" and accuracy not in POINTS_MAP:
+        return f"Unknown accuracy: {accuracy}."
+
+    path = job["path"]
+    model = FunctionModel()
+
+    success, error = model.set_fx(job["fx"])
+    if not success:
+        return error
+    success, error = model.set_gx(job["gx"])
+    if not success:
+        return error
+
+    try:
+        x_min, x_max = float(job["x_min"]), float(job["x_max"])
+    except (TypeError, ValueError):
+        return "X min and X max must be numbers."
+    if x_min >= x_max:
+        return "X min must be less than X max."
+
+    plan = model.plan_solve(
+        x_min, x_max,
+        method=None if method == "Auto" else method,
+        accuracy=None if accuracy == "Auto" else accuracy,
+    )
+    x_values = np.linspace(x_min, x_max, plan["points"])
+    if plan["method"] == "Symbolic":
+        intersections, error = model.find_intersections_symbolic(x_values)
+    else:
+        intersections, error = model.find_intersections_numerical(x_values)
+    if error and model.fx != model.gx:
+        return error
+
+    y_fx, error = model.evaluate(model.fx, x_values)
+    if error:
+        return error
+    y_gx, error = model.evaluate(model.gx, x_values)
+    if error:
+        return error
+    if np.isscalar(y_fx):
+        y_fx = np.full_like(x_values, y_fx)
+    if np.isscalar(y_gx):
+        y_gx = np.full_like(x_values, y_gx)
+
+    figure = Figure(figsize=job.get("figsize", (8, 6)), dpi=job.get("dpi", 100))
+    FigureCanvasAgg(figure)
+    draw_solution(figure.add_subplot(), x_values, y_fx, y_gx, intersections)
+    try:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        figure.savefig(path, bbox_inches='tight')
+    except Exception as e:
+        return f"Could not save the plot: {str(e)}"
+    return None
+
+
+def export_batch(jobs, processes=None):
+    """Render ``jobs`` across worker processes.
+
+    Returns the ``(path, error)`` results in job order. ``processes``
+    defaults to the number of CPUs; with one process or one job the work
+    runs in the calling process.
+    """
+    jobs = list(jobs)
+    processes = processes or os.cpu_count() or 1
+    if processes == 1 or len(jobs) <= 1:
+        return [render_job(job) for job in jobs]
+
+    chunksize = max(1, len(jobs) // (processes * 4))
+    with ProcessPoolExecutor(max_workers=min(processes, len(jobs))) as executor:
+        return list(executor.map(render_job, jobs, chunksize=chunksize))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render PyMathPlot figures offscreen.")
+    parser.add_argument("jobs", help="JSON file holding a list of render jobs")
+    parser.add_argument("-j", "--processes", type=int, default=None, help="number of worker processes")
+    args = parser.parse_args(argv)
+
+    with open(args.jobs) as f:
+        jobs = json.load(f)
+
+    failed = 0
+    for path, error in export_batch(jobs, args.processes):
+        if error:
+            failed += 1
+            print(f"{path}: {error}")
+        else:
+            print(path)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,237 @@
+"""Scripted GUI replay for measuring interactive latency.
+
+Drives a real ``MainWindow``/``MainController`` pair offscreen through a
+recorded script and reports, per step, the time from the input event to
+the end of the resulting paint, the time until background refinement
+has been painted too, and the canvas draw times::
+
+    QT_QPA_PLATFORM=offscreen python -m src.replay script.json --repeat 5
+
+A script is a JSON list of steps:
+
+    {"action": "type", "target": "fx_input", "text": "x^2"}      one sample per key
+    {"action": "clear", "target": "fx_input"}
+    {"action": "select", "target": "method_combo", "text": "Numerical"}
+    {"action": "click", "target": "solve_btn"}
+    {"action": "zoom", "factor": 0.5}                             < 1 zooms in
+
+Without a script file the built-in ``DEFAULT_SCRIPT`` is replayed.
+"""
+import argparse
+import json
+import os
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import numpy as np
+from PySide2.QtCore import QObject, QEvent, Qt
+from PySide2.QtTest import QTest
+from PySide2.QtWidgets import QApplication, QMessageBox
+
+from src.model import FunctionModel
+from src.view import MainWindow
+from src.controller import MainController
+
+DEFAULT_SCRIPT = [
+    {"action": "type", "target": "fx_input", "text": "x^2"},
+    {"action": "click", "target": "fx_plot_btn"},
+    {"action": "type", "target": "gx_input", "text": "log10(x)"},
+    {"action": "click", "target": "gx_plot_btn"},
+    {"action": "select", "target": "method_combo", "text": "Numerical"},
+    {"action": "select", "target": "accuracy_combo", "text": "High"},
+    {"action": "click", "target": "solve_btn"},
+    {"action": "click", "target": "fit_btn"},
+    {"action": "zoom", "factor": 0.5},
+    {"action": "zoom", "factor": 2.0},
+    {"action": "click", "target": "reset_btn"},
+]
+
+PERCENTILES = (50, 90, 99)
+
+
+class _PaintProbe(QObject):
+    def __init__(self):
+        super().__init__()
+        self.paints = 0
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Paint:
+            self.paints += 1
+        return False
+
+
+class ReplayHarness:
+    def __init__(self, app=None, paint_timeout=2.0, idle_grace=0.05, refine_timeout=60.0):
+        self.app = app or QApplication.instance() or QApplication([])
+        self.paint_timeout = paint_timeout
+        self.idle_grace = idle_grace
+        self.refine_timeout = refine_timeout
+        self.model = FunctionModel()
+        self.view = MainWindow()
+        self.controller = MainController(self.model, self.view)
+        self.dialogs = 0
+        self._draw_times = []
+
+        # Time every canvas draw, including the idle draws of the toolbar
+        draw = self.view.canvas.draw
+
+        def timed_draw(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return draw(*args, **kwargs)
+            finally:
+                self._draw_times.append(time.perf_counter() - start)
+
+        self.view.canvas.draw = timed_draw
+        self._probe = _PaintProbe()
+        self.app.installEventFilter(self._probe)
+        self.view.show()
+        self._settle()
+
+    def _dismiss_dialog(self, *args, **kwargs):
+        # Modal dialogs would block the replay; count them instead
+        self.dialogs += 1
+        return QMessageBox.Ok
+
+    def _settle(self):
+        """Process events until the last paint is done and the queue is idle"""
+        start = time.perf_counter()
+        while True:
+            paints = self._probe.paints
+            self.app.processEvents()
+            now = time.perf_counter()
+            if self._probe.paints == paints and (paints > 0 or now - start > self.idle_grace):
+                return now
+            if now - start > self.paint_timeout:
+                return now
+
+    def close(self):
+        self.app.removeEventFilter(self._probe)
+        self.view.close()
+
+    def _measure(self, label, action):
+        self._probe.paints = 0
+        self._draw_times = []
+        start = time.perf_counter()
+        action()
+        end = self._settle()
+        painted = self._probe.paints > 0
+
+        # Plot and Solve keep refining in the background after the first paint
+        complete = end
+        if self.controller.is_refining():
+            while self.controller.is_refining() and time.perf_counter() - start < self.refine_timeout:
+                self.app.processEvents()
+                time.sleep(0.001)
+            complete = self._settle()
+        return {
+            "action": label,
+            "latency": end - start,
+            "complete": complete - start,
+            "painted": painted,
+            "draws": list(self._draw_times),
+        }
+
+    def _zoom(self, factor):
+        ax = self.view.figure.gca()
+        for get_lim, set_lim in ((ax.get_xlim, ax.set_xlim), (ax.get_ylim, ax.set_ylim)):
+            lo, hi = get_lim()
+            center, half = (lo + hi) / 2, (hi - lo) / 2 * factor
+            set_lim(center - half, center + half)
+        self.view.canvas.draw_idle()
+
+    def run_step(self, step):
+        action = step["action"]
+        widget = getattr(self.view, step["target"]) if "target" in step else None
+
+        if action == "type":
+            return [
+                self._measure(f"type {step['target']}", lambda key=key: QTest.keyClicks(widget, key))
+                for key in step["text"]
+            ]
+        if action == "clear":
+            return [self._measure(f"clear {step['target']}", widget.clear)]
+        if action == "select":
+            return [self._measure(
+                f"select {step['target']}", lambda: widget.setCurrentText(step["text"])
+            )]
+        if action == "click":
+            return [self._measure(
+                f"click {step['target']}", lambda: QTest.mouseClick(widget, Qt.LeftButton)
+            )]
+        if action == "zoom":
+            return [self._measure("zoom", lambda: self._zoom(step["factor"]))]
+        raise ValueError(f"Unknown replay action: {action}")
+
+    def run(self, script, repeat=1):
+        warning, information = QMessageBox.warning, QMessageBox.information
+        QMessageBox.warning = QMessageBox.information = self._dismiss_dialog
+        try:
+            samples = []
+            for _ in range(repeat):
+                for step in script:
+                    samples.extend(self.run_step(step))
+            return samples
+        finally:
+            QMessageBox.warning, QMessageBox.information = warning, information
+
+
+def summarize(samples, percentiles=PERCENTILES):
+    """First paint, completion and draw time percentiles, in seconds, grouped by action"""
+    groups = {}
+    for sample in samples:
+        groups.setdefault(sample["action"], []).append(sample)
+
+    summary = {}
+    for action, group in groups.items():
+        latencies = np.array([sample["latency"] for sample in group])
+        completes = np.array([sample.get("complete", sample["latency"]) for sample in group])
+        draws = np.array([draw for sample in group for draw in sample["draws"]])
+        summary[action] = {
+            "count": len(group),
+            "latency": dict(zip(percentiles, np.percentile(latencies, percentiles))),
+            "complete": dict(zip(percentiles, np.percentile(completes, percentiles))),
+            "draw": dict(zip(percentiles, np.percentile(draws, percentiles))) if len(draws) else None,
+        }
+    return summary
+
+
+def format_summary(summary):
+    header = "".join(f"{'p' + str(p):>9}" for p in PERCENTILES)
+    lines = [f"{'action':<26}{'n':>5}   paint ms{header}   done ms{header}   draw ms{header}"]
+    for action, stats in summary.items():
+        columns = []
+        for key in ("latency", "complete", "draw"):
+            if stats[key] is None:
+                columns.append("".join(f"{'-':>9}" for _ in PERCENTILES))
+            else:
+                columns.append("".join(f"{stats[key][p] * 1000:>9.1f}" for p in PERCENTILES))
+        lines.append(f"{action:<26}{stats['count']:>5}   " + "   ".join(f"{'':>7}{column}" for column in columns))
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay a GUI script and report interactive latency.")
+    parser.add_argument("script", nargs="?", help="JSON file holding a list of replay steps")
+    parser.add_argument("--repeat", type=int, default=1, help="number of times to replay the script")
+    parser.add_argument("--json", action="store_true", help="print the raw samples as JSON")
+    args = parser.parse_args(argv)
+
+    script = DEFAULT_SCRIPT
+    if args.script:
+        with open(args.script) as f:
+            script = json.load(f)
+
+    harness = ReplayHarness()
+    samples = harness.run(script, repeat=args.repeat)
+    harness.close()
+    if args.json:
+        print(json.dumps(samples, indent=2))
+    else:
+        print(format_summary(summarize(samples)))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
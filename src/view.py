@@ -1,14 +1,134 @@
-from PySide2.QtCore import Qt
+from PySide2.QtCore import Qt, QAbstractTableModel, QModelIndex
 from PySide2.QtWidgets import (
     QComboBox, QWidget, QHBoxLayout, QVBoxLayout, QGridLayout, QLabel, QPushButton,
-    QLineEdit, QGroupBox, QSpacerItem, QSizePolicy, QMenuBar, QMenu, QAction, QStatusBar, QListWidget, QMainWindow
-    ,QMessageBox
+    QLineEdit, QGroupBox, QCheckBox, QSpacerItem, QSizePolicy, QMenuBar, QMenu, QAction, QStatusBar, QTableView, QMainWindow
+    ,QMessageBox, QHeaderView
 )
-from PySide2.QtGui import QIntValidator
+from PySide2.QtGui import QIntValidator, QDoubleValidator
+import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
 
+class SolutionsTableModel(QAbstractTableModel):
+    """Table model over an (N, k) array of solution points.
+
+    Cells are formatted only when the view asks for them and sorting
+    permutes a row index instead of the points themselves.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._points = np.empty((0, 2))
+        self._headers = ("x", "y")
+        self._order = np.arange(0)
+        self._sort_key = None
+        self._message = None
+
+    def set_points(self, points, headers=("x", "y")):
+        self.beginResetModel()
+        self._points = np.asarray(points, dtype=np.float64).reshape(-1, len(headers))
+        self._headers = tuple(headers)
+        self._order = self._sorted_order()
+        self._message = None
+        self.endResetModel()
+
+    def append_points(self, points):
+        """Insert rows in sorted position, keeping the selection and scroll position"""
+        points = np.asarray(points, dtype=np.float64).reshape(-1, len(self._headers))
+        if self._message is not None:
+            self.set_points(points, self._headers)
+            return
+        if not len(points):
+            return
+
+        start = len(self._points)
+        self._points = np.concatenate([self._points, points])
+        new, positions = self._insert_positions(np.arange(start, len(self._points)))
+
+        # New rows landing between the same two existing rows go in as one block
+        inserted = 0
+        for position in np.unique(positions):
+            block = new[positions == position]
+            row = position + inserted
+            self.beginInsertRows(QModelIndex(), row, row + len(block) - 1)
+            self._order = np.insert(self._order, row, block)
+            self.endInsertRows()
+            inserted += len(block)
+
+    def _insert_positions(self, new):
+        """Order ``new`` point indices and find where each goes in the current rows"""
+        if self._sort_key is None or self._sort_key[0] >= self._points.shape[1]:
+            return new, np.full(len(new), len(self._order))
+        column, order = self._sort_key
+        new = new[np.argsort(self._points[new, column], kind="stable")]
+        values = self._points[self._order, column]
+        new_values = self._points[new, column]
+        if order == Qt.DescendingOrder:
+            # Matches _sorted_order, which reverses a stable ascending sort
+            new, new_values = new[::-1], new_values[::-1]
+            return new, len(values) - np.searchsorted(values[::-1], new_values, side="right")
+        return new, np.searchsorted(values, new_values, side="right")
+
+    def set_message(self, message):
+        self.beginResetModel()
+        self._points = np.empty((0, len(self._headers)))
+        self._order = np.arange(0)
+        self._message = message
+        self.endResetModel()
+
+    def clear(self):
+        self.set_points([])
+
+    def point(self, row):
+        if self._message is not None or not 0 <= row < len(self._order):
+            return None
+        return tuple(self._points[self._order[row]])
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return 1 if self._message is not None else len(self._order)
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._headers)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if self._message is not None:
+            if role == Qt.DisplayRole and index.column() == 0:
+                return self._message
+            return None
+        if role == Qt.DisplayRole:
+            return f"{self._points[self._order[index.row()], index.column()]:.4f}"
+        if role == Qt.TextAlignmentRole:
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self._headers[section] if section < len(self._headers) else None
+        return str(section + 1)
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        self.layoutAboutToBeChanged.emit()
+        self._sort_key = (column, order)
+        self._order = self._sorted_order()
+        self.layoutChanged.emit()
+
+    def _sorted_order(self):
+        if self._sort_key is None or self._sort_key[0] >= self._points.shape[1]:
+            return np.arange(len(self._points))
+        column, order = self._sort_key
+        indices = np.argsort(self._points[:, column], kind="stable")
+        return indices[::-1] if order == Qt.DescendingOrder else indices
+
+
 class MainWindow(QMainWindow):  # Inherit from QMainWindow
     def __init__(self):
         super().__init__()
@@ -43,6 +163,9 @@ class MainWindow(QMainWindow):  # Inherit from QMainWindow
         self.function_layout.addWidget(self.gx_input, 1, 1)
         self.function_layout.addWidget(self.gx_plot_btn, 1, 2)
 
+        self.live_checkbox = QCheckBox("Live plot while typing")
+        self.function_layout.addWidget(self.live_checkbox, 2, 0, 1, 3)
+
         self.function_group.setLayout(self.function_layout)
         self.left_panel.addWidget(self.function_group)
 
@@ -57,7 +180,7 @@ class MainWindow(QMainWindow):  # Inherit from QMainWindow
 
         self.method_label = QLabel("Method: ")
         self.method_combo = QComboBox()
-        self.method_combo.addItems(["Numerical", "Symbolic"])
+        self.method_combo.addItems(["Numerical", "Symbolic", "Auto"])
         self.method_combo.setCurrentText("Symbolic")
 
         self.methods_layout.addWidget(self.method_label)
@@ -68,7 +191,7 @@ class MainWindow(QMainWindow):  # Inherit from QMainWindow
 
         self.accuracy_label = QLabel("Accuracy:")
         self.accuracy_combo = QComboBox()
-        self.accuracy_combo.addItems(["Low", "Medium", "High"])
+        self.accuracy_combo.addItems(["Low", "Medium", "High", "Auto"])
         self.accuracy_combo.setCurrentText("Medium")
 
         self.accuracy_layout.addWidget(self.accuracy_label)
@@ -91,6 +214,35 @@ class MainWindow(QMainWindow):  # Inherit from QMainWindow
         self.range_group.setLayout(self.range_layout)
         self.left_panel.addWidget(self.range_group)
 
+        self.sweep_group = QGroupBox("Parameter Sweep")
+        self.sweep_layout = QGridLayout()
+
+        self.sweep_param_label = QLabel("Parameter:")
+        self.sweep_param_input = QLineEdit("a")
+        self.sweep_from_label = QLabel("From:")
+        self.sweep_from_input = QLineEdit("0.1")
+        self.sweep_from_input.setValidator(QDoubleValidator())
+        self.sweep_to_label = QLabel("To:")
+        self.sweep_to_input = QLineEdit("1")
+        self.sweep_to_input.setValidator(QDoubleValidator())
+        self.sweep_count_label = QLabel("Steps:")
+        self.sweep_count_input = QLineEdit("100")
+        self.sweep_count_input.setValidator(QIntValidator(2, 100000))
+        self.sweep_btn = QPushButton("Sweep")
+
+        self.sweep_layout.addWidget(self.sweep_param_label, 0, 0)
+        self.sweep_layout.addWidget(self.sweep_param_input, 0, 1)
+        self.sweep_layout.addWidget(self.sweep_count_label, 0, 2)
+        self.sweep_layout.addWidget(self.sweep_count_input, 0, 3)
+        self.sweep_layout.addWidget(self.sweep_from_label, 1, 0)
+        self.sweep_layout.addWidget(self.sweep_from_input, 1, 1)
+        self.sweep_layout.addWidget(self.sweep_to_label, 1, 2)
+        self.sweep_layout.addWidget(self.sweep_to_input, 1, 3)
+        self.sweep_layout.addWidget(self.sweep_btn, 2, 0, 1, 4)
+
+        self.sweep_group.setLayout(self.sweep_layout)
+        self.left_panel.addWidget(self.sweep_group)
+
         self.actions_group = QGroupBox("Actions")
         self.actions_layout = QHBoxLayout()
         self.solve_btn = QPushButton("Solve")
@@ -102,7 +254,16 @@ class MainWindow(QMainWindow):  # Inherit from QMainWindow
 
         self.solutions_group = QGroupBox("Solutions")
         self.solutions_layout = QVBoxLayout()
-        self.solutions_list = QListWidget()
+        self.solutions_model = SolutionsTableModel(self)
+        self.solutions_list = QTableView()
+        self.solutions_list.setModel(self.solutions_model)
+        self.solutions_list.setSortingEnabled(True)
+        self.solutions_list.sortByColumn(0, Qt.AscendingOrder)
+        self.solutions_list.setSelectionBehavior(QTableView.SelectRows)
+        self.solutions_list.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        # Fixed row heights let the view skip measuring rows it never shows
+        self.solutions_list.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.solutions_list.verticalHeader().setDefaultSectionSize(24)
         self.solutions_layout.addWidget(self.solutions_list)
         self.solutions_group.setLayout(self.solutions_layout)
         self.left_panel.addWidget(self.solutions_group)
@@ -170,13 +331,16 @@ class MainWindow(QMainWindow):  # Inherit from QMainWindow
             QStatusBar {
                 font-size: 12px;
             }
-            QListWidget {
+            QTableView {
                 font-size: 14px;
             }
         """)
     
     def _show_usage_notes(self):
         QMessageBox.information(self, "Usage Notes", 
+            "Function Inputs\n"
+            "   - Live plot while typing: redraws shortly after you stop typing, without error dialogs.\n"
+            "     Problems with the input are shown in the status bar.\n\n"
             "Plot Range\n"
             "   - X min: The minimum value of the x-axis for the plot.\n"
             "   - X max: The maximum value of the x-axis for the plot.\n"
@@ -184,7 +348,15 @@ class MainWindow(QMainWindow):  # Inherit from QMainWindow
             "Plotting Accuracy\n"
             "   -Low: Uses fewer points for plotting, resulting in faster performance but lower accuracy.\n"
             "   -Medium: A balance between performance and accuracy.\n"
-            "   -High: Uses more points for plotting, resulting in higher accuracy but slower performance."
+            "   -High: Uses more points for plotting, resulting in higher accuracy but slower performance.\n"
+            "   -Auto: Picks the number of points from the range and how fast the functions oscillate.\n\n"
+            "Solving Method\n"
+            "   -Auto: Estimates the cost of each method from the expressions and earlier solve times,\n"
+            "    picks the cheaper one and shows the choice in the status bar.\n\n"
+            "Parameter Sweep\n"
+            "   - Use the parameter (e.g. 'a') in f(x) and g(x), such as a*x^2 and log10(x).\n"
+            "   - Sweep solves f(x) = g(x) for every parameter value between From and To\n"
+            "     and plots the roots x against the parameter."
         )
 
     def _show_about(self):
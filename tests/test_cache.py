@@ -0,0 +1,88 @@
+import sqlite3
+import pytest
+from unittest.mock import patch
+from sympy import symbols, sqrt, Rational
+from src.cache import SolutionCache
+from src.model import FunctionModel
+
+x = symbols('x')
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = SolutionCache(str(tmp_path / "solutions.sqlite"))
+    yield cache
+    cache.close()
+
+def test_get_missing_key(cache):
+    assert cache.get("missing") is None
+
+def test_put_get_roundtrip(cache):
+    key = cache.key(x**2 - 2)
+    cache.put(key, [-sqrt(2), sqrt(2)])
+    assert cache.get(key) == [-sqrt(2), sqrt(2)]
+
+def test_empty_root_set_is_cached(cache):
+    cache.put("no roots", [])
+    assert cache.get("no roots") == []
+
+def test_persists_across_instances(tmp_path):
+    path = str(tmp_path / "solutions.sqlite")
+    first = SolutionCache(path)
+    first.put("half", [Rational(1, 2)])
+    first.close()
+
+    second = SolutionCache(path)
+    assert second.get("half") == [Rational(1, 2)]
+    second.close()
+
+def test_version_mismatch_drops_entries(tmp_path):
+    path = str(tmp_path / "solutions.sqlite")
+    cache = SolutionCache(path)
+    cache.put("half", [Rational(1, 2)])
+    cache.close()
+
+    conn = sqlite3.connect(path)
+    with conn:
+        conn.execute("UPDATE meta SET value = 'old' WHERE key = 'version'")
+    conn.close()
+
+    cache = SolutionCache(path)
+    assert cache.get("half") is None
+    cache.close()
+
+def test_evicts_least_recently_used(tmp_path):
+    cache = SolutionCache(str(tmp_path / "solutions.sqlite"), max_bytes=45)
+    cache.put("a", [Rational(1, 2)])
+    cache.put("b", [Rational(1, 3)])
+    cache.get("a")
+    cache.put("c", [Rational(1, 4)])
+    assert cache.size() <= 45
+    assert cache.get("a") is not None
+    assert cache.get("b") is None
+    cache.close()
+
+def test_model_reuses_cached_roots_for_other_ranges(cache):
+    model = FunctionModel(solution_cache=cache)
+    model.set_fx("x^2")
+    model.set_gx("4")
+    with patch('src.model.solve', wraps=__import__('sympy').solve) as mock_solve:
+        wide, err = model.find_intersections_symbolic([-10, 10])
+        narrow, _ = model.find_intersections_symbolic([0, 10])
+    assert err is None
+    assert mock_solve.call_count == 1
+    assert sorted(x for x, _ in wide) == [-2.0, 2.0]
+    assert [x for x, _ in narrow] == [2.0]
+
+def test_timing_ratios_persist(tmp_path):
+    path = str(tmp_path / "solutions.sqlite")
+    cache = SolutionCache(path)
+    for ratio in (1.0, 2.0, 3.0):
+        cache.record_timing("Numerical", ratio, keep=2)
+    cache.close()
+
+    cache = SolutionCache(path)
+    assert cache.timing_ratios("Numerical", 10) == [2.0, 3.0]
+    assert cache.timing_ratios("Symbolic", 10) == []
+    model = FunctionModel(solution_cache=cache)
+    assert model._timing_correction("Numerical") == 2.5
+    cache.close()
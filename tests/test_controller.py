@@ -1,15 +1,20 @@
 import pytest
 from unittest.mock import Mock, patch
 import numpy as np
-from src.controller import MainController
+from matplotlib.figure import Figure
+from src.controller import MainController, COARSE_POINTS
+from src.render import MAX_LABELS
 from PySide2.QtWidgets import QMessageBox
 
 class TestMainController:
     @pytest.fixture
     def mock_controller(self):
         model = Mock()
+        model.needs_guard.return_value = False
         view = Mock()
+        view.figure.gca.return_value = Figure().add_subplot()
         controller = MainController(model, view)
+        controller._thread_pool = Mock()
         return controller, model, view
 
     def test_validate_range_valid(self, mock_controller):
@@ -49,12 +54,9 @@ class TestMainController:
         model.set_gx.return_value = (True, None)
         model.intersections = [(1.5, 2.25), (3.0, 4.5)]
         
-        x_values = np.linspace(-5, 5, 1000)
-        model.evaluate = Mock(side_effect=[
-            (np.zeros_like(x_values), None),  # y_fx
-            (np.zeros_like(x_values), None)   # y_gx
-        ])
+        model.evaluate = Mock(side_effect=lambda func, x_values: (np.zeros_like(x_values), None))
         model.find_intersections_symbolic.return_value = (model.intersections, None)
+        model.plan_solve.return_value = {"method": "Symbolic", "points": 1000, "predicted_seconds": 0.1}
         
         view.fx_input.text.return_value = "x**2"
         view.gx_input.text.return_value = "x"
@@ -62,12 +64,224 @@ class TestMainController:
         view.xmax_input.text.return_value = "5"
         view.accuracy_combo.currentText.return_value = "High"
         view.method_combo.currentText.return_value = "Symbolic"
-        view.figure.gca.return_value = Mock()
         view.canvas.draw = Mock()
         
         controller.solve()
-        view.solutions_list.addItem.assert_any_call("x = 1.5000, y = 2.2500")
-        view.solutions_list.addItem.assert_any_call("x = 3.0000, y = 4.5000")
+        controller._thread_pool.start.assert_called_once_with(controller._job)
+        controller._job.run()
+
+        view.solutions_model.append_points.assert_called_once_with([(1.5, 2.25), (3.0, 4.5)])
+        assert not controller.is_refining()
+
+    def test_solve_auto_method(self, mock_controller):
+        controller, model, view = mock_controller
+        model.set_fx.return_value = (True, None)
+        model.set_gx.return_value = (True, None)
+        model.intersections = [(2.0, 4.0)]
+        model.evaluate.side_effect = lambda func, x_values: (np.zeros_like(x_values), None)
+        model.plan_solve.return_value = {"method": "Numerical", "points": 200, "predicted_seconds": 0.5}
+
+        view.fx_input.text.return_value = "x^2"
+        view.gx_input.text.return_value = "log10(x)"
+        view.xmin_input.text.return_value = "1"
+        view.xmax_input.text.return_value = "5"
+        view.accuracy_combo.currentText.return_value = "Medium"
+        view.method_combo.currentText.return_value = "Auto"
+        view.figure.gca.return_value = Figure().add_subplot()
+
+        model.fx, model.gx = "fx", "gx"
+        model.iter_intersections_numerical.return_value = iter([[(2.0, 4.0)]])
+
+        controller.solve()
+        assert "Auto: Numerical, 200 points" in view.status_bar.showMessage.call_args[0][0]
+        controller._job.run()
+
+        model.plan_solve.assert_called_once_with(1.0, 5.0, method=None, accuracy="Medium")
+        assert len(model.iter_intersections_numerical.call_args[0][0]) == 200
+        assert model.record_timing.call_args[0][:2] == ("Numerical", 0.5)
+        message = view.status_bar.showMessage.call_args[0][0]
+        assert "Auto: Numerical, 200 points, predicted 0.50 s." in message
+
+    def test_solve_skips_timing_for_cached_roots(self, mock_controller):
+        controller, model, view = mock_controller
+        model.set_fx.return_value = (True, None)
+        model.set_gx.return_value = (True, None)
+        model.evaluate.side_effect = lambda func, x_values: (np.zeros_like(x_values), None)
+        model.plan_solve.return_value = {"method": "Symbolic", "points": 200, "predicted_seconds": 0.5}
+        model.find_intersections_symbolic.return_value = ([(2.0, 4.0)], None)
+        view.fx_input.text.return_value = "x^2"
+        view.gx_input.text.return_value = "4"
+        view.xmin_input.text.return_value = "-5"
+        view.xmax_input.text.return_value = "5"
+        view.method_combo.currentText.return_value = "Auto"
+
+        model._last_solve_cached = True
+        controller.solve()
+        controller._job.run()
+        model.record_timing.assert_not_called()
+
+        model._last_solve_cached = False
+        controller.solve()
+        with patch('src.controller.time.perf_counter', side_effect=[10.0, 10.25, 11.0]):
+            controller._job.run()
+        model.record_timing.assert_called_once_with("Symbolic", 0.5, 0.25)
+
+    def test_solve_draws_coarse_pass_first(self, mock_controller):
+        controller, model, view = mock_controller
+        model.set_fx.return_value = (True, None)
+        model.set_gx.return_value = (True, None)
+        model.evaluate.side_effect = lambda func, x_values: (np.zeros_like(x_values), None)
+        model.plan_solve.return_value = {"method": "Symbolic", "points": 5000, "predicted_seconds": 1.0}
+        view.fx_input.text.return_value = "x^2"
+        view.gx_input.text.return_value = "4"
+        view.xmin_input.text.return_value = "-5"
+        view.xmax_input.text.return_value = "5"
+        ax = Figure().add_subplot()
+        view.figure.gca.return_value = ax
+
+        controller.solve()
+
+        view.canvas.draw.assert_called_once()
+        assert len(ax.lines[0].get_xdata()) == COARSE_POINTS
+        assert controller.is_refining()
+
+        model.find_intersections_symbolic.return_value = ([(2.0, 4.0), (-2.0, 4.0)], None)
+        controller._job.run()
+        assert len(ax.lines[0].get_xdata()) == 5000
+        assert len(ax.collections) == 1
+        assert model.intersections == [(2.0, 4.0), (-2.0, 4.0)]
+
+    def test_refinement_rescales_to_full_resolution(self, mock_controller):
+        controller, model, view = mock_controller
+        model.set_fx.return_value = (True, None)
+        model.set_gx.return_value = (True, None)
+        model.evaluate.side_effect = lambda func, x_values: (1 / x_values if func == "fx" else None, None)
+        model.fx, model.gx = "fx", "gx"
+        model.plan_solve.return_value = {"method": "Numerical", "points": 20000, "predicted_seconds": None}
+        model.iter_intersections_numerical.return_value = iter([])
+        view.fx_input.text.return_value = "1/x"
+        view.gx_input.text.return_value = "0"
+        view.xmin_input.text.return_value = "-10"
+        view.xmax_input.text.return_value = "10"
+        ax = Figure().add_subplot()
+        view.figure.gca.return_value = ax
+
+        controller.solve()
+        coarse_top = ax.get_ylim()[1]
+        controller._job.run()
+
+        assert ax.get_ylim()[1] > 10 * coarse_top
+        assert ax.get_ylim()[1] >= 1e3
+
+    @pytest.mark.parametrize("method", ["Symbolic", None])
+    def test_refinement_error_replaces_progress_message(self, mock_controller, method):
+        controller, model, view = mock_controller
+        model.evaluate.side_effect = lambda func, x_values: (np.zeros_like(x_values), None)
+        controller._plot_functions(np.linspace(0, 1, 10))
+        model.evaluate.side_effect = lambda func, x_values: (None, "Error evaluating function: boom")
+        model.find_intersections_symbolic.return_value = ([], "Error solving: boom")
+        controller._start_refinement(np.linspace(0, 1, 10), {
+            "method": method, "predicted_seconds": None, "auto_note": "", "message": "Solving...",
+        })
+        assert view.status_bar.showMessage.call_args[0][0] == "Solving..."
+
+        with patch('PySide2.QtWidgets.QMessageBox.warning') as mock_warning:
+            controller._job.run()
+            mock_warning.assert_called_once()
+        message, timeout = view.status_bar.showMessage.call_args[0]
+        assert "boom" in message
+        assert timeout == 5000
+
+    def test_coarse_pass_leaves_risky_functions_to_refinement(self, mock_controller):
+        controller, model, view = mock_controller
+        model.fx, model.gx = "fx", "gx"
+        model.needs_guard.side_effect = lambda func, size: func == "fx"
+        model.evaluate.side_effect = lambda func, x_values: (np.ones_like(x_values), None)
+        ax = Figure().add_subplot()
+        view.figure.gca.return_value = ax
+
+        controller._draw_coarse(-5, 5, 1000)
+
+        assert [call[0][0] for call in model.evaluate.call_args_list] == ["gx"]
+        assert np.isnan(ax.lines[0].get_ydata()).all()
+        controller._on_refined_curves(controller._job_id, np.linspace(-5, 5, 1000), np.full(1000, 50.0), np.ones(1000))
+        assert ax.get_ylim()[1] >= 50
+
+    def test_stale_refinement_is_ignored(self, mock_controller):
+        controller, model, view = mock_controller
+        view.xmin_input.text.return_value = "-5"
+        view.xmax_input.text.return_value = "5"
+        view.accuracy_combo.currentText.return_value = "Low"
+        model.evaluate.side_effect = lambda func, x_values: (np.zeros_like(x_values), None)
+        view.figure.gca.return_value = Figure().add_subplot()
+
+        controller.plot()
+        stale = controller._job
+        controller.plot()
+        stale.run()
+        view.canvas.draw_idle.assert_not_called()
+
+        controller._job.run()
+        view.canvas.draw_idle.assert_called_once()
+        assert not controller.is_refining()
+
+    def test_live_update_is_debounced(self, mock_controller):
+        controller, model, view = mock_controller
+        controller._live_timer = Mock()
+        view.live_checkbox.isChecked.return_value = True
+        job = Mock()
+        controller._job = job
+
+        controller._schedule_live_update("x^")
+        controller._schedule_live_update("x^2")
+
+        assert controller._live_timer.start.call_count == 2
+        job.cancel.assert_called_once()
+        assert not controller.is_refining()
+        model.set_fx.assert_not_called()
+
+    def test_live_update_disabled(self, mock_controller):
+        controller, _, view = mock_controller
+        controller._live_timer = Mock()
+        view.live_checkbox.isChecked.return_value = False
+
+        controller._schedule_live_update("x")
+
+        controller._live_timer.start.assert_not_called()
+
+    def test_live_update_invalid_input(self, mock_controller):
+        controller, model, view = mock_controller
+        view.fx_input.text.return_value = "x^"
+        view.gx_input.text.return_value = ""
+        model.set_fx.return_value = (False, "Error parsing expression: invalid syntax")
+
+        with patch('PySide2.QtWidgets.QMessageBox.warning') as mock_warning:
+            controller.live_update()
+            mock_warning.assert_not_called()
+
+        view.status_bar.showMessage.assert_called_with("f(x): Error parsing expression: invalid syntax")
+        controller._thread_pool.start.assert_not_called()
+
+    def test_live_update_plots(self, mock_controller):
+        controller, model, view = mock_controller
+        view.fx_input.text.return_value = "x^2"
+        view.gx_input.text.return_value = ""
+        view.xmin_input.text.return_value = "-5"
+        view.xmax_input.text.return_value = "5"
+        view.accuracy_combo.currentText.return_value = "Low"
+        model.set_fx.return_value = (True, None)
+        model.set_gx.return_value = (True, None)
+        model.fx, model.gx = "fx", None
+        model.evaluate.side_effect = lambda func, x_values: (
+            (None, None) if func is None else (x_values ** 2, None)
+        )
+
+        controller.live_update()
+
+        model.set_gx.assert_called_once_with(None)
+        view.canvas.draw.assert_not_called()
+        view.canvas.draw_idle.assert_called_once()
+        controller._thread_pool.start.assert_called_once_with(controller._job)
 
     def test_reset(self, mock_controller):
         controller, model, view = mock_controller
@@ -75,11 +289,79 @@ class TestMainController:
         
         view.fx_input.clear.assert_called_once()
         view.gx_input.clear.assert_called_once()
-        view.solutions_list.clear.assert_called_once()
+        view.solutions_model.clear.assert_called_once()
         
         view.xmin_input.setText.assert_called_with("-10")
         view.xmax_input.setText.assert_called_with("10")
 
+    def test_zoom_to_solution(self, mock_controller):
+        controller, _, view = mock_controller
+        view.solutions_model.point.return_value = (1.5, 2.25)
+        index = Mock()
+        index.row.return_value = 0
+
+        controller.zoom_to_solution(index)
+
+        assert controller.ax.get_xlim() == (-0.5, 3.5)
+        assert controller.ax.get_ylim() == (0.25, 4.25)
+        view.canvas.draw.assert_called()
+
+    def test_sweep(self, mock_controller):
+        controller, model, view = mock_controller
+        view.fx_input.text.return_value = "a*x"
+        view.gx_input.text.return_value = "1"
+        view.xmin_input.text.return_value = "0"
+        view.xmax_input.text.return_value = "10"
+        view.accuracy_combo.currentText.return_value = "Low"
+        view.sweep_param_input.text.return_value = "a"
+        view.sweep_from_input.text.return_value = "1"
+        view.sweep_to_input.text.return_value = "2"
+        view.sweep_count_input.text.return_value = "3"
+        table = np.array([(1.0, 1.0, 1.0), (1.5, 2 / 3, 1.0), (2.0, 0.5, 1.0)])
+        model.find_intersections_sweep.return_value = (table, None)
+        view.figure.gca.return_value = Figure().add_subplot()
+
+        controller.sweep()
+
+        args = model.find_intersections_sweep.call_args[0]
+        assert args[:3] == ("a*x", "1", "a")
+        np.testing.assert_allclose(args[3], [1, 1.5, 2])
+        view.solutions_model.set_points.assert_called_once_with(table, headers=("a", "x", "y"))
+        view.canvas.draw.assert_called_once()
+
+    def test_sweep_auto_accuracy_ignores_plotted_functions(self, mock_controller):
+        controller, model, view = mock_controller
+        view.fx_input.text.return_value = "a*x"
+        view.gx_input.text.return_value = "1"
+        view.xmin_input.text.return_value = "0"
+        view.xmax_input.text.return_value = "10"
+        view.accuracy_combo.currentText.return_value = "Auto"
+        view.sweep_param_input.text.return_value = "a"
+        view.sweep_from_input.text.return_value = "1"
+        view.sweep_to_input.text.return_value = "2"
+        view.sweep_count_input.text.return_value = "3"
+        model.find_intersections_sweep.return_value = (np.empty((0, 3)), None)
+
+        controller.sweep()
+
+        model.plan_solve.assert_not_called()
+        assert len(model.find_intersections_sweep.call_args[0][4]) == 500
+
+    def test_sweep_invalid_steps(self, mock_controller):
+        controller, model, view = mock_controller
+        view.fx_input.text.return_value = "a*x"
+        view.gx_input.text.return_value = "1"
+        view.xmin_input.text.return_value = "0"
+        view.xmax_input.text.return_value = "10"
+        view.sweep_from_input.text.return_value = "1"
+        view.sweep_to_input.text.return_value = "2"
+        view.sweep_count_input.text.return_value = "1"
+
+        with patch('PySide2.QtWidgets.QMessageBox.warning') as mock_warning:
+            controller.sweep()
+            mock_warning.assert_called_once()
+        model.find_intersections_sweep.assert_not_called()
+
     def test_plot_functions(self, mock_controller):
         controller, model, view = mock_controller
         
@@ -91,4 +373,59 @@ class TestMainController:
         
         ax = controller._plot_functions(x_values)
         
-        assert ax is not None
\ No newline at end of file
+        assert ax is not None
+
+    def test_annotate_solutions_single_marker_collection(self, mock_controller):
+        controller, model, _ = mock_controller
+        model.intersections = [(x, 0.0) for x in np.linspace(-5, 5, 5000)]
+        ax = Figure().add_subplot()
+        ax.set_xlim(-5, 5)
+        ax.set_ylim(-1, 1)
+
+        controller._annotate_solutions(ax)
+
+        assert len(ax.collections) == 1
+        assert len(ax.lines) == 0
+        assert len(ax.texts) == MAX_LABELS
+
+    def test_annotate_solutions_labels_only_visible_roots(self, mock_controller):
+        controller, model, _ = mock_controller
+        model.intersections = [(1.0, 1.0), (2.0, 2.0), (8.0, 8.0)]
+        ax = Figure().add_subplot()
+        ax.set_xlim(0, 10)
+        ax.set_ylim(0, 10)
+        controller._annotate_solutions(ax)
+        assert len(ax.texts) == 3
+
+        ax.set_xlim(0, 5)
+
+        assert len(ax.texts) == 2
+        assert all(text.get_bbox_patch() is not None for text in ax.texts)
+
+    def test_annotate_solutions_relabels_on_y_zoom(self, mock_controller):
+        controller, model, _ = mock_controller
+        model.intersections = [(1.0, 1.0), (1.0, 50.0)]
+        ax = Figure().add_subplot()
+        ax.set_xlim(0, 10)
+        ax.set_ylim(0, 10)
+        controller._annotate_solutions(ax)
+        assert [text.xy for text in ax.texts] == [(1.0, 1.0)]
+
+        ax.set_xbound(0, 5)
+        ax.set_ybound(40, 60)
+
+        assert [text.xy for text in ax.texts] == [(1.0, 50.0)]
+
+    def test_zoom_to_solution_relabels(self, mock_controller):
+        controller, model, view = mock_controller
+        model.intersections = [(1.0, 1.0), (1.0, 50.0)]
+        controller.ax.set_xlim(0, 10)
+        controller.ax.set_ylim(0, 10)
+        controller._annotate_solutions(controller.ax)
+        view.solutions_model.point.return_value = (1.0, 50.0)
+        index = Mock()
+        index.row.return_value = 1
+
+        controller.zoom_to_solution(index)
+
+        assert [text.xy for text in controller.ax.texts] == [(1.0, 50.0)]
@@ -0,0 +1,17 @@
+import pytest
+from src.guard import run_limited, ResourceLimitError
+
+def test_run_limited_returns_result():
+    assert run_limited(sorted, ([3, 1, 2],)) == [1, 2, 3]
+
+def test_run_limited_reports_worker_errors():
+    with pytest.raises(ResourceLimitError, match="invalid literal"):
+        run_limited(int, ("x",))
+
+def test_run_limited_cpu_limit():
+    with pytest.raises(ResourceLimitError, match="limit exceeded"):
+        run_limited(pow, (10, 10 ** 10), cpu_seconds=1)
+
+def test_run_limited_memory_limit():
+    with pytest.raises(ResourceLimitError, match="memory limit exceeded"):
+        run_limited(bytearray, (8 * 1024 ** 3,), memory_bytes=512 * 1024 ** 2)
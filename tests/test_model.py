@@ -1,6 +1,11 @@
+import copy
+import threading
+import time
 import pytest
 import numpy as np
-from src.model import FunctionModel
+from unittest.mock import patch
+from src.model import FunctionModel, MAX_AUTO_POINTS, COMPILE_CACHE_SIZE, expression_cost
+from src.guard import run_limited
 from sympy import Symbol
 
 @pytest.fixture
@@ -134,4 +139,199 @@ def test_parse_expression_valid(function_model):
 def test_parse_expression_with_constants(function_model):
     expr = function_model._parse_expression("pi*x + e")
     assert expr is not None
-    assert Symbol('x') in expr.free_symbols
\ No newline at end of file
+    assert Symbol('x') in expr.free_symbols
+
+def test_parse_expression_with_parameter(function_model):
+    a = Symbol('a')
+    expr = function_model._parse_expression("a*x^2", (a,))
+    assert expr.free_symbols == {Symbol('x'), a}
+
+def test_find_intersections_sweep(function_model):
+    table, err = function_model.find_intersections_sweep(
+        "x^2", "a", "a", [1, 4, 9], np.linspace(-5, 5, 1001)
+    )
+    assert err is None
+    np.testing.assert_allclose(table[:, 0], [1, 1, 4, 4, 9, 9])
+    np.testing.assert_allclose(table[:, 1], [-1, 1, -2, 2, -3, 3], atol=1e-8)
+    np.testing.assert_allclose(table[:, 2], table[:, 0], atol=1e-7)
+    assert function_model.sweep_results is table
+
+def test_find_intersections_sweep_rejects_poles(function_model):
+    table, err = function_model.find_intersections_sweep(
+        "tan(x)", "a", "a", [1], np.linspace(-3, 3, 601)
+    )
+    assert err is None
+    np.testing.assert_allclose(table[:, 1], [-3 * np.pi / 4, np.pi / 4], atol=1e-8)
+
+def test_find_intersections_sweep_guards_risky_expressions(function_model):
+    with patch("src.model.run_limited", wraps=run_limited) as limited:
+        table, err = function_model.find_intersections_sweep(
+            "2^1000*x", "2^1000*a", "a", [0.25, 0.55], np.linspace(-1, 1, 101)
+        )
+    assert err is None
+    limited.assert_called_once()
+    np.testing.assert_allclose(table[:, 1], [0.25, 0.55], atol=1e-8)
+
+def test_find_intersections_sweep_unknown_symbol(function_model):
+    table, err = function_model.find_intersections_sweep("a*x + b", "1", "a", [1, 2], [0, 1])
+    assert len(table) == 0
+    assert "Unknown symbol(s) used" in err
+
+def test_find_intersections_sweep_invalid_parameter(function_model):
+    _, err = function_model.find_intersections_sweep("x", "1", "pi", [1, 2], [0, 1])
+    assert "Invalid parameter name" in err
+
+def test_expression_features(function_model):
+    function_model.set_fx("x^3 - 2*x")
+    function_model.set_gx("sin(4*x)")
+    features = function_model.expression_features(-5, 5)
+    assert features["degree"] is None
+    assert features["transcendental"] == 1
+    assert features["frequency"] == 4
+    assert features["width"] == 10
+
+def test_plan_solve_polynomial_prefers_symbolic(function_model):
+    function_model.set_fx("x^2")
+    function_model.set_gx("4")
+    plan = function_model.plan_solve(-10, 10)
+    assert plan["method"] == "Symbolic"
+    assert plan["features"]["degree"] == 2
+    assert plan["predicted_seconds"] > 0
+
+def test_plan_solve_transcendental_mix_uses_numerical(function_model):
+    function_model.set_fx("x^2")
+    function_model.set_gx("log10(x)")
+    assert function_model.plan_solve(0.1, 10)["method"] == "Numerical"
+
+def test_plan_solve_samples_oscillations(function_model):
+    function_model.set_fx("sin(100*x)")
+    function_model.set_gx("0")
+    assert function_model.plan_solve(-10, 10)["points"] > function_model.plan_solve(-10, 10, accuracy="High")["points"]
+    function_model.set_fx("sin(10000*x)")
+    assert function_model.plan_solve(-1000, 1000)["points"] == MAX_AUTO_POINTS
+
+def test_plan_solve_keeps_explicit_choices(function_model):
+    function_model.set_fx("x^2")
+    function_model.set_gx("4")
+    plan = function_model.plan_solve(-10, 10, method="Numerical", accuracy="Low")
+    assert plan["method"] == "Numerical"
+    assert plan["points"] == 100
+    assert plan["predicted_seconds"] is None
+
+def test_plan_solve_bounds_degree_without_expanding(function_model):
+    function_model.set_fx("(x+1)^5000")
+    function_model.set_gx("x^3*(x-2)^2")
+    start = time.perf_counter()
+    plan = function_model.plan_solve(-10, 10)
+    assert time.perf_counter() - start < 1
+    assert plan["features"]["degree"] == 5000
+
+def test_record_timing_corrects_estimates(function_model):
+    function_model.set_fx("x^2")
+    function_model.set_gx("4")
+    predicted = function_model.plan_solve(-10, 10, method="Numerical")["predicted_seconds"]
+    function_model.record_timing("Numerical", predicted, predicted / 10)
+    assert function_model.plan_solve(-10, 10, method="Numerical")["predicted_seconds"] == pytest.approx(predicted / 10)
+
+def test_evaluate_reuses_compiled_function(function_model):
+    function_model.set_fx("x^2")
+    function_model.evaluate(function_model.fx, [1, 2])
+    compiled = function_model._compiled[function_model.fx]
+    function_model.evaluate(function_model.fx, [3, 4])
+    assert function_model._compiled[function_model.fx] is compiled
+
+def test_caches_stay_bounded_across_threads(function_model):
+    worker = copy.copy(function_model)
+
+    def compile_many(model, offset):
+        for i in range(COMPILE_CACHE_SIZE * 4):
+            model.set_fx(f"x + {offset + i}")
+            model.evaluate(model.fx, [1, 2])
+
+    threads = [threading.Thread(target=compile_many, args=(model, n * 1000))
+               for n, model in enumerate([function_model, worker] * 2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(function_model._compiled) == COMPILE_CACHE_SIZE
+    assert len(function_model._parsed) == COMPILE_CACHE_SIZE
+
+def test_evaluate_parallel_matches_single_thread(function_model):
+    function_model.set_fx("sin(x) + x^2")
+    x_vals = np.linspace(-10, 10, 10001)
+    expected, _ = function_model.evaluate(function_model.fx, x_vals)
+    function_model.eval_threads = 4
+    function_model.parallel_min_points = 1000
+    y_vals, err = function_model.evaluate(function_model.fx, x_vals)
+    assert err is None
+    np.testing.assert_array_equal(y_vals, expected)
+
+@pytest.mark.parametrize("min_points", [0, 1, 2])
+@pytest.mark.parametrize("size", [0, 1, 7])
+def test_evaluate_parallel_tiny_threshold(function_model, min_points, size):
+    function_model.set_fx("x^2")
+    function_model.eval_threads = 4
+    function_model.parallel_min_points = min_points
+    x_vals = np.linspace(0, 1, size)
+    y_vals, err = function_model.evaluate(function_model.fx, x_vals)
+    assert err is None
+    np.testing.assert_array_equal(y_vals, x_vals ** 2)
+
+def test_evaluate_parallel_constant_function(function_model):
+    function_model.set_fx("5")
+    function_model.eval_threads = 4
+    function_model.parallel_min_points = 10
+    y_vals, err = function_model.evaluate(function_model.fx, np.linspace(0, 1, 100))
+    assert err is None
+    assert np.all(y_vals == 5)
+
+@pytest.mark.parametrize("expression", ["9^9^9^9", "factorial(10^6)", "exp(10^6)", "x + 2^(2^30)"])
+def test_set_fx_rejects_pathological_numbers(function_model, expression):
+    res, err = function_model.set_fx(expression)
+    assert res is False
+    assert "too large to evaluate safely" in err
+
+def test_set_fx_rejects_deep_expression(function_model):
+    res, err = function_model.set_fx("sin(" * 150 + "x" + ")" * 150)
+    assert res is False
+    assert "too large to evaluate safely" in err
+
+@pytest.mark.parametrize("expression", ["x + 2*1e-400", "x + 1e-400", "x*0.0"])
+def test_set_fx_accepts_tiny_floats(function_model, expression):
+    res, err = function_model.set_fx(expression)
+    assert res is True
+    assert err is None
+
+def test_expression_cost_of_huge_float(function_model):
+    cost = expression_cost(function_model._parse_expression("x + 2*1e400"))
+    assert 400 < cost["digits"] < 402
+
+def test_expression_cost(function_model):
+    cost = expression_cost(function_model._parse_expression("x^2 + 2^1000"))
+    assert cost["depth"] == 3
+    assert cost["nodes"] == 7
+    assert 301 < cost["digits"] < 400
+
+def test_risky_expression_runs_in_worker(function_model):
+    function_model.set_fx("2^1000*x")
+    function_model.set_gx("1")
+    assert function_model._is_risky(function_model.fx)
+    y_vals, err = function_model.evaluate(function_model.fx, [1.0, 2.0])
+    assert err is None
+    assert y_vals[0] == pytest.approx(2.0 ** 1000)
+    assert not function_model.needs_guard(function_model.fx, 2)
+    assert function_model.needs_guard(function_model.fx, 3)
+    assert not function_model.needs_guard(function_model.gx, 3)
+
+    intersections, err = function_model.find_intersections_symbolic([-1, 1])
+    assert err is None
+    assert intersections[0][0] == pytest.approx(2.0 ** -1000)
+
+def test_parse_expression_is_cached(function_model):
+    first = function_model._parse_expression("x^2 + 1")
+    assert function_model._parse_expression("x^2 + 1") is first
+    with pytest.raises(ValueError):
+        function_model._parse_expression("x + y")
+    with pytest.raises(ValueError):
+        function_model._parse_expression("x + y")
@@ -0,0 +1,73 @@
+import pytest
+import numpy as np
+from matplotlib.figure import Figure
+from src.render import format_si, draw_solution, render_job, export_batch, MAX_LABELS
+
+def test_format_si():
+    assert format_si(0) == "0 "
+    assert format_si(1500) == "1.5k"
+    assert format_si(-0.002) == "-2.0m"
+
+def test_draw_solution_caps_labels():
+    ax = Figure().add_subplot()
+    x_values = np.linspace(-5, 5, 100)
+    points = [(x, 0.0) for x in np.linspace(-5, 5, 1000)]
+    draw_solution(ax, x_values, np.zeros_like(x_values), np.ones_like(x_values), points)
+    assert len(ax.lines) == 2
+    assert len(ax.collections) == 1
+    assert len(ax.texts) <= MAX_LABELS
+
+@pytest.mark.parametrize("extension, magic", [
+    ("png", b"\x89PNG"),
+    ("svg", b"<?xml"),
+    ("pdf", b"%PDF"),
+])
+def test_render_job_formats(tmp_path, extension, magic):
+    path = str(tmp_path / f"plot.{extension}")
+    result = render_job({"fx": "x^2", "gx": "4", "x_min": -5, "x_max": 5, "path": path})
+    assert result == (path, None)
+    with open(path, "rb") as f:
+        assert f.read(5).startswith(magic)
+
+def test_render_job_invalid_expression(tmp_path):
+    path = str(tmp_path / "plot.png")
+    _, error = render_job({"fx": "x+y", "gx": "x", "x_min": -5, "x_max": 5, "path": path})
+    assert "Error parsing expression" in error
+
+def test_render_job_identical_functions(tmp_path):
+    path = str(tmp_path / "plot.png")
+    assert render_job({"fx": "x", "gx": "x", "x_min": -5, "x_max": 5, "path": path}) == (path, None)
+
+def test_export_batch_in_processes(tmp_path):
+    jobs = [
+        {"fx": f"{a}*x", "gx": "1", "x_min": -5, "x_max": 5,
+         "method": "Numerical", "path": str(tmp_path / f"plot_{a}.png")}
+        for a in range(1, 5)
+    ]
+    results = export_batch(jobs, processes=2)
+    assert [path for path, _ in results] == [job["path"] for job in jobs]
+    assert all(error is None for _, error in results)
+
+def test_render_job_auto_choices(tmp_path):
+    path = str(tmp_path / "plot.png")
+    job = {"fx": "x^2", "gx": "4", "x_min": -5, "x_max": 5, "path": path,
+           "method": "Auto", "accuracy": "Auto"}
+    assert render_job(job) == (path, None)
+
+def test_render_job_missing_keys(tmp_path):
+    path = str(tmp_path / "plot.png")
+    assert render_job({"fx": "x", "path": path}) == (path, "Missing job keys: gx, x_min, x_max.")
+    _, error = render_job({"fx": "x", "gx": "1", "x_min": -5, "x_max": 5})
+    assert error == "Missing job keys: path."
+
+def test_export_batch_keeps_going_after_bad_jobs(tmp_path):
+    good = str(tmp_path / "good.png")
+    jobs = [
+        {"fx": "x", "gx": "1", "x_min": "a", "x_max": 5, "path": str(tmp_path / "bad.png")},
+        {"fx": "x", "gx": "1", "x_min": -5, "x_max": 5, "accuracy": "Extreme", "path": str(tmp_path / "odd.png")},
+        {"fx": "x", "gx": "1", "x_min": -5, "x_max": 5, "method": "Numerical", "path": good},
+    ]
+    results = export_batch(jobs, processes=2)
+    assert results[0][1] == "X min and X max must be numbers."
+    assert results[1][1] == "Unknown accuracy: Extreme."
+    assert results[2] == (good, None)
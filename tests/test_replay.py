@@ -0,0 +1,35 @@
+import pytest
+from PySide2.QtWidgets import QApplication
+from src.replay import ReplayHarness, summarize, format_summary
+
+@pytest.fixture(scope="session")
+def app():
+    return QApplication.instance() or QApplication([])
+
+def test_summarize_percentiles():
+    samples = [
+        {"action": "click solve_btn", "latency": latency / 1000, "painted": True, "draws": [latency / 2000]}
+        for latency in range(1, 101)
+    ] + [{"action": "type fx_input", "latency": 0.002, "painted": True, "draws": []}]
+    summary = summarize(samples)
+    assert summary["click solve_btn"]["count"] == 100
+    assert summary["click solve_btn"]["latency"][50] == pytest.approx(0.0505)
+    assert summary["click solve_btn"]["draw"][99] == pytest.approx(0.0495, rel=1e-3)
+    assert summary["type fx_input"]["draw"] is None
+    assert "click solve_btn" in format_summary(summary)
+
+def test_replay_script(qtbot, app):
+    harness = ReplayHarness(app)
+    samples = harness.run([
+        {"action": "type", "target": "fx_input", "text": "x^2"},
+        {"action": "type", "target": "gx_input", "text": "4"},
+        {"action": "click", "target": "solve_btn"},
+        {"action": "zoom", "factor": 0.5},
+        {"action": "click", "target": "reset_btn"},
+    ])
+    harness.close()
+    assert [sample["action"] for sample in samples].count("type fx_input") == 3
+    solve = next(sample for sample in samples if sample["action"] == "click solve_btn")
+    assert solve["draws"]
+    assert solve["complete"] >= solve["latency"]
+    assert harness.dialogs == 0
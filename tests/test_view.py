@@ -1,6 +1,7 @@
 import pytest
+import numpy as np
 from PySide2.QtWidgets import QApplication
-from src.view import MainWindow
+from src.view import MainWindow, SolutionsTableModel
 from PySide2.QtCore import Qt
 
 @pytest.fixture(scope="session")
@@ -51,3 +52,59 @@ def test_user_input(qtbot, gui):
     assert gui.gx_input.text() == "x + 1"
     qtbot.mouseClick(gui.fx_plot_btn, Qt.LeftButton)
 
+def test_solutions_model_formats_rows(app):
+    model = SolutionsTableModel()
+    model.set_points([(1.5, 2.25), (-3.0, 4.5)])
+    assert model.rowCount() == 2
+    assert model.columnCount() == 2
+    assert model.data(model.index(0, 0)) == "1.5000"
+    assert model.data(model.index(1, 1)) == "4.5000"
+    assert model.headerData(0, Qt.Horizontal) == "x"
+
+def test_solutions_model_sort_keeps_points(app):
+    model = SolutionsTableModel()
+    points = np.array([(3.0, 0.0), (1.0, 1.0), (2.0, 2.0)])
+    model.set_points(points)
+    model.sort(0, Qt.DescendingOrder)
+    assert model.point(0) == (3.0, 0.0)
+    assert model.point(2) == (1.0, 1.0)
+    model.sort(1, Qt.AscendingOrder)
+    assert model.point(0) == (3.0, 0.0)
+    np.testing.assert_array_equal(points, [(3.0, 0.0), (1.0, 1.0), (2.0, 2.0)])
+
+@pytest.mark.parametrize("order", [Qt.AscendingOrder, Qt.DescendingOrder])
+def test_solutions_model_append_inserts_rows(app, order):
+    model = SolutionsTableModel()
+    model.set_points([(1.0, 0.0), (3.0, 0.0)])
+    model.sort(0, order)
+    resets, inserts = [], []
+    model.modelReset.connect(lambda: resets.append(True))
+    model.rowsInserted.connect(lambda parent, first, last: inserts.append((first, last)))
+    model.append_points([(4.0, 0.0), (2.0, 0.0), (5.0, 0.0)])
+
+    assert not resets
+    assert model.rowCount() == 5
+    xs = [model.point(row)[0] for row in range(5)]
+    assert xs == sorted(xs, reverse=order == Qt.DescendingOrder)
+    model.sort(0, order)
+    assert [model.point(row)[0] for row in range(5)] == xs
+
+def test_solutions_model_append_replaces_message(app):
+    model = SolutionsTableModel()
+    model.set_message("No solutions found.")
+    model.append_points([(1.0, 2.0)])
+    assert model.rowCount() == 1
+    assert model.point(0) == (1.0, 2.0)
+
+def test_solutions_model_message(app):
+    model = SolutionsTableModel()
+    model.set_message("No solutions found.")
+    assert model.rowCount() == 1
+    assert model.data(model.index(0, 0)) == "No solutions found."
+    assert model.point(0) is None
+
+def test_solutions_table_uses_model(gui):
+    assert gui.solutions_list.model() is gui.solutions_model
+
+def test_live_plot_is_opt_in(gui):
+    assert gui.live_checkbox.isChecked() is False